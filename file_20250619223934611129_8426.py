@@ -95,4 +95,298 @@ class PrimeTools:
             return []
         all_primes_up_to_end = self.generate_primes_up_to(end)
         primes_in_range = [p for p in all_primes_up_to_end if p >= start]
-        return primes_in_range
\ No newline at end of file
+        return primes_in_range
+# Additional implementation at 2026-10-20 09:14:06
+import math
+import time
+import random
+from itertools import compress
+
+_BasicPrimeTools = PrimeTools
+
+
+class PrimeTools(_BasicPrimeTools):
+    """
+    PrimeTools backed by a shared small-prime cache, a segmented odd-only
+    Sieve of Eratosthenes and deterministic Miller-Rabin for 64-bit inputs.
+    """
+
+    SEGMENT_SIZE = 1 << 20
+    MILLER_RABIN_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+
+    _small_primes = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37]
+    _small_prime_set = frozenset(_small_primes)
+    _small_primes_limit = 37
+
+    @classmethod
+    def small_primes(cls, limit: int) -> list[int]:
+        """
+        Returns the cached list of primes, extended by a plain sieve so it covers at
+        least limit. The cache is shared by every instance and never shrinks.
+        """
+        if limit > cls._small_primes_limit:
+            new_limit = max(limit, 2 * cls._small_primes_limit)
+            sieve = bytearray([1]) * (new_limit + 1)
+            sieve[0:2] = b'\0\0'
+            for p in range(2, math.isqrt(new_limit) + 1):
+                if sieve[p]:
+                    sieve[p * p::p] = bytes(len(range(p * p, new_limit + 1, p)))
+            cls._small_primes = list(compress(range(new_limit + 1), sieve))
+            cls._small_prime_set = frozenset(cls._small_primes)
+            cls._small_primes_limit = new_limit
+        return cls._small_primes
+
+    def _odd_segments(self, start: int, stop=None, segment_size: int = None):
+        """
+        Yields (low, flags) for consecutive segments where flags[i] is 1 iff
+        low + 2 * i is prime. low is odd and >= 3; stop (exclusive) may be None
+        for an unbounded sieve.
+        """
+        segment_size = segment_size or self.SEGMENT_SIZE
+        low = max(3, start | 1)
+        zeros = memoryview(bytes(segment_size))
+        while stop is None or low < stop:
+            high = low + 2 * segment_size
+            if stop is not None:
+                high = min(high, stop)
+            count = (high - low + 1) // 2
+            flags = bytearray([1]) * count
+            for p in self.small_primes(math.isqrt(high - 1))[1:]:
+                first = max(p * p, (low + p - 1) // p * p)
+                if not first & 1:
+                    first += p
+                if first >= high:
+                    continue
+                index = (first - low) // 2
+                flags[index::p] = zeros[:len(range(index, count, p))]
+            yield low, flags
+            low += 2 * count
+
+    def prime_generator(self, start: int = 2):
+        """
+        Unbounded generator of primes >= start, produced one sieve segment at a time.
+        """
+        if start <= 2:
+            yield 2
+        for low, flags in self._odd_segments(start):
+            yield from compress(range(low, low + 2 * len(flags), 2), flags)
+
+    def get_primes_in_range(self, start: int, end: int) -> list[int]:
+        if start > end or end < 2:
+            return []
+        primes = [2] if start <= 2 else []
+        for low, flags in self._odd_segments(start, end + 1):
+            primes.extend(compress(range(low, low + 2 * len(flags), 2), flags))
+        return primes
+
+    def generate_primes_up_to(self, limit: int) -> list[int]:
+        return self.get_primes_in_range(2, limit)
+
+    def count_primes_up_to(self, limit: int) -> int:
+        """
+        pi(limit), counted per segment without materialising the primes.
+        """
+        if limit < 2:
+            return 0
+        return 1 + sum(flags.count(1) for _, flags in self._odd_segments(3, limit + 1))
+
+    def is_prime(self, n: int) -> bool:
+        """
+        Exact for n < 3.3 * 10**24 (which covers all 64-bit integers); above that it
+        is a strong probable-prime test to the first twelve prime bases.
+        """
+        if n <= self._small_primes_limit:
+            return n in self._small_prime_set
+        for p in self.MILLER_RABIN_BASES:
+            if n % p == 0:
+                return False
+        d = n - 1
+        s = 0
+        while not d & 1:
+            d >>= 1
+            s += 1
+        for a in self.MILLER_RABIN_BASES:
+            x = pow(a, d, n)
+            if x == 1 or x == n - 1:
+                continue
+            for _ in range(s - 1):
+                x = x * x % n
+                if x == n - 1:
+                    break
+            else:
+                return False
+        return True
+
+
+def benchmark_prime_tools(limit: int = 10 ** 9, baseline_limit: int = 10 ** 7, bulk_size: int = 100_000,
+                          baseline_bulk_size: int = 2_000, seed: int = 0) -> dict:
+    """
+    Times the segmented sieve up to limit and bulk Miller-Rabin checks on random
+    64-bit integers. The original list sieve and trial division are timed at
+    baseline_limit and on baseline_bulk_size integers below 10**10, since they do
+    not finish in reasonable time or memory at full size.
+    """
+    results = {}
+    rng = random.Random(seed)
+    new = PrimeTools()
+    old = _BasicPrimeTools()
+
+    t0 = time.perf_counter()
+    results["segmented_pi"] = new.count_primes_up_to(limit)
+    results["segmented_sieve_seconds"] = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    results["list_sieve_pi_at_baseline"] = len(old.generate_primes_up_to(baseline_limit))
+    results["list_sieve_seconds_at_baseline"] = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    new.count_primes_up_to(baseline_limit)
+    results["segmented_sieve_seconds_at_baseline"] = time.perf_counter() - t0
+
+    numbers = [rng.getrandbits(64) | 1 for _ in range(bulk_size)]
+    t0 = time.perf_counter()
+    results["miller_rabin_primes"] = sum(map(new.is_prime, numbers))
+    results["miller_rabin_seconds"] = time.perf_counter() - t0
+
+    small_numbers = [rng.randrange(10 ** 9, 10 ** 10) | 1 for _ in range(baseline_bulk_size)]
+    t0 = time.perf_counter()
+    trial = [old.is_prime(n) for n in small_numbers]
+    results["trial_division_seconds_at_baseline"] = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    results["miller_rabin_agrees_at_baseline"] = [new.is_prime(n) for n in small_numbers] == trial
+    results["miller_rabin_seconds_at_baseline"] = time.perf_counter() - t0
+    return results
+
+
+if __name__ == "__main__":
+    # Demo sizes; benchmark_prime_tools() with its defaults measures pi(10**9).
+    for name, value in benchmark_prime_tools(limit=10 ** 7, baseline_limit=10 ** 5, bulk_size=10_000,
+                                             baseline_bulk_size=500).items():
+        print(f"{name}: {value}")
+
+# Additional implementation at 2026-10-20 10:41:33
+import os
+import math
+import random
+import collections
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor
+
+TRIAL_DIVISION_LIMIT = 1 << 16
+
+
+def _init_prime_worker(small_prime_limit):
+    # Under fork the parent's cache is inherited and this is a no-op; under spawn
+    # each worker rebuilds the table once instead of once per chunk.
+    PrimeTools.small_primes(small_prime_limit)
+
+
+def _is_prime_chunk(chunk):
+    tools = PrimeTools()
+    return [tools.is_prime(n) for n in chunk]
+
+
+def _factorize_chunk(chunk):
+    tools = PrimeTools()
+    return [tools.factorize(n) for n in chunk]
+
+
+def _pollard_brent(n, rng):
+    """
+    Returns a non-trivial factor of the odd composite n using Brent's variant of
+    Pollard's rho, batching gcd computations over blocks of steps.
+    """
+    while True:
+        y = rng.randrange(1, n)
+        c = rng.randrange(1, n)
+        block = 128
+        g = r = q = 1
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            k = 0
+            while k < r and g == 1:
+                ys = y
+                for _ in range(min(block, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = math.gcd(q, n)
+                k += block
+            r *= 2
+        if g == n:
+            g = 1
+            while g == 1:
+                ys = (ys * ys + c) % n
+                g = math.gcd(abs(x - ys), n)
+        if g != n:
+            return g
+
+
+_SievePrimeTools = PrimeTools
+
+
+class PrimeTools(_SievePrimeTools):
+    """
+    Adds factorisation and batch APIs that spread work over a process pool.
+    """
+
+    def factorize(self, n: int) -> list[int]:
+        """
+        Prime factors of n in ascending order, with multiplicity. Small factors come
+        from trial division by the cached small-prime table, the rest from
+        Pollard's rho with Miller-Rabin to recognise primes.
+        """
+        if n < 1:
+            raise ValueError("factorize() requires a positive integer.")
+        factors = []
+        for p in self.small_primes(TRIAL_DIVISION_LIMIT):
+            if p * p > n:
+                break
+            while n % p == 0:
+                factors.append(p)
+                n //= p
+        if n == 1:
+            return factors
+
+        rng = random.Random(n)
+        stack = [n]
+        while stack:
+            m = stack.pop()
+            if m < TRIAL_DIVISION_LIMIT * TRIAL_DIVISION_LIMIT or self.is_prime(m):
+                # Every factor below the trial division limit has already been removed,
+                # so any cofactor below its square is prime.
+                factors.append(m)
+                continue
+            d = _pollard_brent(m, rng)
+            stack.extend((d, m // d))
+        factors.sort()
+        return factors
+
+    def _map_chunks(self, worker, numbers, chunk_size, workers):
+        workers = workers or os.cpu_count() or 1
+        iterator = iter(numbers)
+        chunks = iter(lambda: list(islice(iterator, chunk_size)), [])
+        self.small_primes(TRIAL_DIVISION_LIMIT)
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_prime_worker,
+                                 initargs=(TRIAL_DIVISION_LIMIT,)) as executor:
+            pending = collections.deque()
+            for chunk in chunks:
+                pending.append(executor.submit(worker, chunk))
+                if len(pending) >= 2 * workers:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+
+    def is_prime_many(self, numbers, chunk_size: int = 10_000, workers: int = None):
+        """
+        Yields is_prime(n) for each n in numbers, in input order. The input is consumed
+        lazily in chunks that are tested on a process pool.
+        """
+        return self._map_chunks(_is_prime_chunk, numbers, chunk_size, workers)
+
+    def factorize_many(self, numbers, chunk_size: int = 1_000, workers: int = None):
+        """
+        Yields factorize(n) for each n in numbers, in input order, computed on a
+        process pool.
+        """
+        return self._map_chunks(_factorize_chunk, numbers, chunk_size, workers)
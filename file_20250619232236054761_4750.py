@@ -97,9 +97,6 @@ def main():
             if os.path.isfile(file_path):
                 _process_single_file(file_path, search_string_processed, not args.ignore_case, allowed_file_types)
 
-if __name__ == "__main__":
-    main()
-
 # Additional implementation at 2025-06-19 23:25:03
 import os
 import argparse
@@ -181,5 +178,614 @@ def main():
         file_types=file_types_list
     )
 
+# Additional implementation at 2026-10-19 09:04:37
+import os
+import re
+import mmap
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+BINARY_SNIFF_BYTES = 8192
+
+
+def _is_binary_sample(sample):
+    """
+    Treats a file as binary if its leading bytes contain a NUL byte,
+    the same heuristic grep and ripgrep use.
+    """
+    return b"\0" in sample
+
+
+def _compile_patterns(patterns, ignore_case=False):
+    """
+    Compiles all search strings into a single bytes regex alternation so every
+    pattern is matched in one scan of the file.
+    """
+    encoded = sorted({p.encode("utf-8") for p in patterns if p}, key=len, reverse=True)
+    if not encoded:
+        raise ValueError("At least one non-empty search pattern is required.")
+    flags = re.IGNORECASE if ignore_case else 0
+    return b"|".join(re.escape(p) for p in encoded), flags
+
+
+def _iter_candidate_files(start_dir, recursive=False, file_types=None):
+    if file_types:
+        file_types_processed = {f".{ft.lstrip('.').lower()}" for ft in file_types}
+    else:
+        file_types_processed = None
+
+    for root, dirs, files in os.walk(start_dir):
+        if not recursive:
+            dirs[:] = []
+        dirs.sort()
+        for filename in sorted(files):
+            if file_types_processed:
+                file_ext = os.path.splitext(filename)[1].lower()
+                if file_ext not in file_types_processed:
+                    continue
+            yield os.path.join(root, filename)
+
+
+def _search_file_mmap(file_path, pattern_source, flags, max_matches=None):
+    """
+    Searches one file for the compiled pattern using a read-only memory map.
+    Returns a list of (line_num, line, matched_text) tuples, decoded as UTF-8,
+    stopping the scan once max_matches lines have been found.
+    """
+    regex = re.compile(pattern_source, flags)
+    matches = []
+    try:
+        with open(file_path, 'rb') as f:
+            if _is_binary_sample(f.read(BINARY_SNIFF_BYTES)):
+                return matches
+            if os.fstat(f.fileno()).st_size == 0:
+                return matches
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                line_num = 1
+                counted_up_to = 0
+                last_line_start = -1
+                for match in regex.finditer(mm):
+                    start = match.start()
+                    line_start = mm.rfind(b"\n", 0, start) + 1
+                    if line_start == last_line_start:
+                        continue
+                    line_num += mm[counted_up_to:line_start].count(b"\n")
+                    counted_up_to = line_start
+                    last_line_start = line_start
+                    line_end = mm.find(b"\n", start)
+                    if line_end == -1:
+                        line_end = len(mm)
+                    line = mm[line_start:line_end].decode('utf-8', errors='ignore')
+                    matches.append((line_num, line.rstrip("\r"), match.group().decode('utf-8', errors='ignore')))
+                    if max_matches is not None and len(matches) >= max_matches:
+                        break
+    except (OSError, ValueError):
+        pass
+    return matches
+
+
+def _search_file_task(task):
+    file_path, pattern_source, flags, max_matches = task
+    return file_path, _search_file_mmap(file_path, pattern_source, flags, max_matches)
+
+
+def parallel_search(start_dir, patterns, recursive=False, ignore_case=False, file_types=None,
+                    workers=None, chunksize=16, max_matches_per_file=None):
+    """
+    Searches files under start_dir for any of the given patterns.
+
+    Files are memory-mapped and scanned as bytes with a single compiled alternation,
+    binary files are skipped, and files are spread across a process pool. Results are
+    yielded as (file_path, line_num, line, matched_text) in deterministic file order
+    while later files are still being searched. max_matches_per_file stops each
+    file's scan after that many matching lines.
+    """
+    if not os.path.isdir(start_dir):
+        raise ValueError(f"Directory not found: {start_dir}")
+
+    pattern_source, flags = _compile_patterns(patterns, ignore_case)
+    if max_matches_per_file is not None and max_matches_per_file <= 0:
+        return
+    tasks = ((path, pattern_source, flags, max_matches_per_file)
+             for path in _iter_candidate_files(start_dir, recursive, file_types))
+
+    if workers == 1:
+        results = map(_search_file_task, tasks)
+        for file_path, matches in results:
+            for line_num, line, matched in matches:
+                yield file_path, line_num, line, matched
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for file_path, matches in executor.map(_search_file_task, tasks, chunksize=chunksize):
+            for line_num, line, matched in matches:
+                yield file_path, line_num, line, matched
+
+
+def _serial_line_search(start_dir, patterns, recursive=False, ignore_case=False, file_types=None):
+    """
+    Baseline matching the text-mode, lowercase-every-line strategy of find_string_in_files,
+    extended to loop over several patterns. Used by benchmark_search.
+    """
+    processed = [p.lower() if ignore_case else p for p in patterns]
+    hits = 0
+    for file_path in _iter_candidate_files(start_dir, recursive, file_types):
+        try:
+            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+                for line in f:
+                    line_processed = line.lower() if ignore_case else line
+                    if any(p in line_processed for p in processed):
+                        hits += 1
+        except IOError:
+            pass
+    return hits
+
+
+def benchmark_search(start_dir, patterns, recursive=True, ignore_case=False, workers=None, repeat=3):
+    """
+    Times the serial line-by-line search against parallel_search on the same tree.
+    Returns a dict of best-of-repeat timings in seconds and the hit counts of each.
+    """
+    serial_times, parallel_times = [], []
+    serial_hits = parallel_hits = 0
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        serial_hits = _serial_line_search(start_dir, patterns, recursive, ignore_case)
+        serial_times.append(time.perf_counter() - t0)
+
+        t0 = time.perf_counter()
+        parallel_hits = sum(1 for _ in parallel_search(start_dir, patterns, recursive, ignore_case,
+                                                       workers=workers))
+        parallel_times.append(time.perf_counter() - t0)
+
+    return {
+        "serial_seconds": min(serial_times),
+        "parallel_seconds": min(parallel_times),
+        "speedup": min(serial_times) / min(parallel_times) if min(parallel_times) else float('inf'),
+        "serial_hits": serial_hits,
+        "parallel_hits": parallel_hits,
+    }
+
+
+# Additional implementation at 2026-10-19 10:12:48
+import os
+import sys
+import json
+import argparse
+from collections import defaultdict
+
+
+def _extract_trigrams(data):
+    """
+    Returns the set of lowercase byte trigrams in data, encoded as latin-1 strings
+    so they can be used as JSON keys.
+    """
+    data = data.lower()
+    return {data[i:i + 3].decode('latin-1') for i in range(len(data) - 2)}
+
+
+class TrigramIndex:
+    """
+    Persistent trigram -> file posting lists for a directory tree.
+
+    Each indexed file is stored with its mtime and size so update() only rereads
+    files that were added or changed since the last build, and its trigram set is
+    kept so a changed file is dropped only from its own posting lists. Queries intersect the
+    posting lists of the search string's trigrams to get a small candidate set,
+    which is then verified against the file contents.
+    """
+
+    VERSION = 1
+
+    def __init__(self, root_directory):
+        self.root_directory = os.path.abspath(root_directory)
+        self.files = {}
+        self.postings = defaultdict(set)
+        self.file_trigrams = {}
+        self.excluded_paths = set()
+
+    def _stat_tree(self):
+        current = {}
+        for dirpath, dirnames, filenames in os.walk(self.root_directory):
+            for filename in filenames:
+                filepath = os.path.join(dirpath, filename)
+                if filepath in self.excluded_paths:
+                    continue
+                try:
+                    st = os.stat(filepath)
+                except OSError:
+                    continue
+                current[filepath] = (st.st_mtime_ns, st.st_size)
+        return current
+
+    def _remove_file(self, filepath):
+        self.files.pop(filepath, None)
+        for trigram in self.file_trigrams.pop(filepath, ()):
+            paths = self.postings[trigram]
+            paths.discard(filepath)
+            if not paths:
+                del self.postings[trigram]
+
+    def _add_file(self, filepath, stamp):
+        try:
+            with open(filepath, 'rb') as f:
+                data = f.read()
+        except OSError:
+            return
+        if _is_binary_sample(data[:BINARY_SNIFF_BYTES]):
+            self.files[filepath] = (stamp[0], stamp[1], False)
+            return
+        trigrams = _extract_trigrams(data)
+        for trigram in trigrams:
+            self.postings[trigram].add(filepath)
+        self.file_trigrams[filepath] = trigrams
+        self.files[filepath] = (stamp[0], stamp[1], True)
+
+    def update(self):
+        """
+        Brings the index in line with the directory tree, reindexing only files whose
+        (mtime, size) changed. Returns (added_or_changed, removed) counts.
+        """
+        current = self._stat_tree()
+        stale = [path for path, entry in self.files.items()
+                 if path not in current or current[path] != tuple(entry[:2])]
+        removed = sum(1 for path in stale if path not in current)
+        for path in stale:
+            self._remove_file(path)
+
+        changed = 0
+        for path, stamp in current.items():
+            if path not in self.files:
+                self._add_file(path, stamp)
+                changed += 1
+        return changed, removed
+
+    def candidates(self, search_string):
+        """
+        Returns the indexed text files that may contain search_string.
+        Strings shorter than three bytes cannot be narrowed and match every text file.
+        """
+        text_files = {path for path, entry in self.files.items() if entry[2]}
+        trigrams = _extract_trigrams(search_string.encode('utf-8'))
+        if not trigrams:
+            return text_files
+        result = None
+        for trigram in sorted(trigrams, key=lambda t: len(self.postings.get(t, ()))):
+            paths = self.postings.get(trigram)
+            if not paths:
+                return set()
+            result = set(paths) if result is None else result & paths
+            if not result:
+                break
+        return result
+
+    def search(self, search_string, ignore_case=False):
+        """
+        Returns the sorted list of files containing search_string, verifying each
+        candidate from the posting lists against its current contents.
+        """
+        needle = search_string.encode('utf-8')
+        if ignore_case:
+            needle = needle.lower()
+        found_files = []
+        for filepath in sorted(self.candidates(search_string)):
+            try:
+                with open(filepath, 'rb') as f:
+                    content = f.read()
+            except OSError:
+                continue
+            if ignore_case:
+                content = content.lower()
+            if needle in content:
+                found_files.append(filepath)
+        return found_files
+
+    def save(self, index_path):
+        paths = sorted(self.files)
+        ids = {path: i for i, path in enumerate(paths)}
+        payload = {
+            "version": self.VERSION,
+            "root": self.root_directory,
+            "files": [[path, *self.files[path]] for path in paths],
+            "postings": {trigram: sorted(ids[p] for p in plist) for trigram, plist in self.postings.items()},
+        }
+        tmp_path = index_path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(payload, f, separators=(',', ':'))
+        os.replace(tmp_path, index_path)
+
+    @classmethod
+    def load(cls, index_path):
+        with open(index_path, 'r', encoding='utf-8') as f:
+            payload = json.load(f)
+        if payload.get("version") != cls.VERSION:
+            raise ValueError(f"Unsupported index version in {index_path}")
+        index = cls(payload["root"])
+        paths = []
+        for path, mtime_ns, size, is_text in payload["files"]:
+            index.files[path] = (mtime_ns, size, is_text)
+            paths.append(path)
+        file_trigrams = defaultdict(set)
+        for trigram, file_ids in payload["postings"].items():
+            index.postings[trigram] = {paths[i] for i in file_ids}
+            for i in file_ids:
+                file_trigrams[paths[i]].add(trigram)
+        index.file_trigrams = dict(file_trigrams)
+        return index
+
+
+def build_trigram_index(root_directory, index_path):
+    """
+    Creates or incrementally refreshes the on-disk index for root_directory.
+    """
+    if os.path.exists(index_path):
+        index = TrigramIndex.load(index_path)
+        if index.root_directory != os.path.abspath(root_directory):
+            index = TrigramIndex(root_directory)
+    else:
+        index = TrigramIndex(root_directory)
+    index_path = os.path.abspath(index_path)
+    index.excluded_paths.update({index_path, index_path + ".tmp"})
+    changed, removed = index.update()
+    index.save(index_path)
+    return index, changed, removed
+
+
+def find_files_containing_string_indexed(root_directory, search_string, index_path, refresh=True):
+    """
+    Index-backed equivalent of find_files_containing_string. When refresh is True the
+    index is first brought up to date (rereading only changed files) and saved back.
+    """
+    if refresh:
+        index, changed, removed = build_trigram_index(root_directory, index_path)
+    else:
+        index = TrigramIndex.load(index_path)
+    return index.search(search_string)
+
+
+INDEX_COMMANDS = ("index", "search")
+
+
+def index_main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Builds and queries a persistent trigram index for repeated string searches."
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    index_parser = subparsers.add_parser("index", help="Build or incrementally update the index.")
+    index_parser.add_argument("directory", type=str, help="The directory tree to index.")
+    index_parser.add_argument("index_file", type=str, help="Where to store the index.")
+
+    search_parser = subparsers.add_parser("search", help="Search using the index.")
+    search_parser.add_argument("index_file", type=str, help="A previously built index.")
+    search_parser.add_argument("search_string", type=str, help="The string to search for.")
+    search_parser.add_argument(
+        "-i", "--ignore-case",
+        action="store_true",
+        help="Perform a case-insensitive search."
+    )
+    search_parser.add_argument(
+        "--no-refresh",
+        action="store_true",
+        help="Query the index as stored without checking for changed files."
+    )
+
+    args = parser.parse_args(argv)
+
+    if args.command == "index":
+        if not os.path.isdir(args.directory):
+            print(f"Error: Directory '{args.directory}' not found.")
+            return
+        index, changed, removed = build_trigram_index(args.directory, args.index_file)
+        print(f"Indexed {len(index.files)} files ({changed} added or changed, {removed} removed).")
+        return
+
+    index = TrigramIndex.load(args.index_file)
+    if not args.no_refresh:
+        index_path = os.path.abspath(args.index_file)
+        index.excluded_paths.update({index_path, index_path + ".tmp"})
+        index.update()
+        index.save(args.index_file)
+    for file_path in index.search(args.search_string, ignore_case=args.ignore_case):
+        print(file_path)
+
+
+def main(argv=None):
+    """
+    Single command-line entry point. "index DIR INDEX_FILE" and "search INDEX_FILE
+    STRING" use the trigram index; anything else is the DIR PATTERN... search.
+    """
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if argv and argv[0] in INDEX_COMMANDS:
+        index_main(argv)
+    else:
+        search_main(argv)
+
+
+# Additional implementation at 2026-10-19 11:27:05
+import os
+import argparse
+
+SEARCH_CHUNK_SIZE = 1 << 16
+
+
+def _file_contains(filepath, search_string, ignore_case=False, chunk_size=SEARCH_CHUNK_SIZE):
+    """
+    Reads filepath in chunks and returns True at the first occurrence of search_string,
+    without reading the rest of the file. Chunks overlap by len(search_string) - 1
+    characters so matches spanning a chunk boundary are not missed.
+    """
+    overlap = len(search_string) - 1
+    carry = ""
+    with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
+        if not search_string:
+            return True
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                return False
+            if ignore_case:
+                chunk = chunk.lower()
+            window = carry + chunk
+            if search_string in window:
+                return True
+            carry = window[-overlap:] if overlap > 0 else ""
+
+
+def iter_string_matches(root_directory, search_string, ignore_case=False, max_matches=None,
+                        max_matches_per_file=None, files_only=False):
+    """
+    Lazily walks root_directory and yields matches as they are found.
+
+    In the default mode yields (filepath, line_num, line) for each matching line. With
+    files_only=True yields each matching filepath once and stops reading that file at
+    its first hit. max_matches caps the total number of results and ends the walk;
+    max_matches_per_file caps the lines reported for any one file. As with the
+    baseline's `in` test, an empty search_string matches every readable file.
+    """
+    if max_matches is not None and max_matches <= 0:
+        return
+    if max_matches_per_file is not None and max_matches_per_file <= 0:
+        return
+    needle = search_string.lower() if ignore_case else search_string
+    emitted = 0
+
+    for dirpath, dirnames, filenames in os.walk(root_directory):
+        dirnames.sort()
+        for filename in sorted(filenames):
+            filepath = os.path.join(dirpath, filename)
+            try:
+                if files_only:
+                    if _file_contains(filepath, needle, ignore_case):
+                        yield filepath
+                        emitted += 1
+                else:
+                    file_hits = 0
+                    with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
+                        for line_num, line in enumerate(f, 1):
+                            line_processed = line.lower() if ignore_case else line
+                            if needle not in line_processed:
+                                continue
+                            yield filepath, line_num, line.rstrip("\r\n")
+                            emitted += 1
+                            file_hits += 1
+                            if max_matches is not None and emitted >= max_matches:
+                                return
+                            if max_matches_per_file is not None and file_hits >= max_matches_per_file:
+                                break
+            except Exception:
+                continue
+            if max_matches is not None and emitted >= max_matches:
+                return
+
+
+def iter_files_containing_string(root_directory, search_string, ignore_case=False, max_matches=None):
+    """
+    Generator form of find_files_containing_string: yields each file containing
+    search_string as soon as its first occurrence is read.
+    """
+    return iter_string_matches(root_directory, search_string, ignore_case=ignore_case,
+                               max_matches=max_matches, files_only=True)
+
+
+def find_files_containing_string(root_directory, search_string, max_matches=None):
+    return list(iter_files_containing_string(root_directory, search_string, max_matches=max_matches))
+
+
+def search_main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Searches a directory tree for one or more strings, streaming matches as they are found."
+    )
+    parser.add_argument(
+        "directory",
+        type=str,
+        help="The directory to start searching from."
+    )
+    parser.add_argument(
+        "patterns",
+        nargs="+",
+        help="One or more strings to search for."
+    )
+    parser.add_argument(
+        "-r", "--recursive",
+        action="store_true",
+        help="Search subdirectories recursively."
+    )
+    parser.add_argument(
+        "-i", "--ignore-case",
+        action="store_true",
+        help="Perform a case-insensitive search."
+    )
+    parser.add_argument(
+        "-f", "--file-types",
+        type=str,
+        help="Comma-separated list of file extensions to include (e.g., 'txt,py,md')."
+    )
+    parser.add_argument(
+        "-j", "--workers",
+        type=int,
+        default=None,
+        help="Number of worker processes (default: CPU count)."
+    )
+    parser.add_argument(
+        "-l", "--files-with-matches",
+        action="store_true",
+        help="Only print the names of matching files, stopping each file at its first hit."
+    )
+    parser.add_argument(
+        "-m", "--max-matches",
+        type=int,
+        default=None,
+        help="Stop after this many results in total."
+    )
+    parser.add_argument(
+        "--max-matches-per-file",
+        type=int,
+        default=None,
+        help="Report at most this many matching lines per file."
+    )
+    parser.add_argument(
+        "--benchmark",
+        action="store_true",
+        help="Compare against the serial line-by-line search instead of printing matches."
+    )
+
+    args = parser.parse_args(argv)
+
+    if not os.path.isdir(args.directory):
+        print(f"Error: Directory '{args.directory}' not found.")
+        return
+
+    file_types_list = None
+    if args.file_types:
+        file_types_list = [ft.strip() for ft in args.file_types.split(',')]
+
+    if args.benchmark:
+        result = benchmark_search(args.directory, args.patterns, args.recursive, args.ignore_case, args.workers)
+        print(f"Serial:   {result['serial_seconds']:.3f}s ({result['serial_hits']} matching lines)")
+        print(f"Parallel: {result['parallel_seconds']:.3f}s ({result['parallel_hits']} matching lines)")
+        print(f"Speedup:  {result['speedup']:.2f}x")
+        return
+
+    if args.max_matches is not None and args.max_matches <= 0:
+        return
+    per_file = 1 if args.files_with_matches else args.max_matches_per_file
+    results = parallel_search(args.directory, args.patterns, args.recursive, args.ignore_case,
+                              file_types_list, args.workers, max_matches_per_file=per_file)
+    emitted = 0
+    try:
+        for file_path, line_num, line, _ in results:
+            if args.files_with_matches:
+                print(file_path)
+            else:
+                print(f"Found in: {file_path} (Line {line_num}): {line.strip()}")
+            emitted += 1
+            if args.max_matches is not None and emitted >= args.max_matches:
+                break
+    finally:
+        results.close()
+
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -170,5 +170,814 @@ def merge_csv_files():
     except Exception as e:
         print(f"An error occurred during merging or saving: {e}")
 
+# Additional implementation at 2026-10-20 19:32:27
+import csv
+import hashlib
+import heapq
+import operator
+import os
+import shutil
+import tempfile
+import numpy as np
+import pandas as pd
+
+# Rough cost of one 16-byte digest held in a Python set (bytes object plus slot).
+_DIGEST_ENTRY_BYTES = 96
+STREAM_BATCH_ROWS = 10_000
+
+
+class RowDigestSet:
+    """
+    Set of 16-byte row digests that stays within a memory budget.
+
+    New digests go into an in-memory set. When that set outgrows the budget it is
+    written to disk as a sorted run and memory-mapped; runs are merged level by level
+    (like an LSM tree) so lookups only have to search a handful of sorted files.
+    Lookups are done a batch at a time with np.searchsorted against each run.
+    """
+
+    def __init__(self, memory_budget=256 * 1024 * 1024, spill_dir=None, fanout=4):
+        self.max_in_memory = max(1, memory_budget // _DIGEST_ENTRY_BYTES)
+        self.fanout = fanout
+        self._spill_parent = spill_dir
+        self._spill_dir = None
+        self._memory = set()
+        self._runs = []  # (level, path, memmap)
+        self._run_counter = 0
+        self.spilled = 0
+
+    def add_new(self, digests):
+        """
+        Adds a batch of digests and returns, for each one, whether it had not been
+        seen before (earlier in the batch included).
+        """
+        on_disk = np.zeros(len(digests), dtype=bool)
+        if self._runs and digests:
+            keys = np.array(digests, dtype='S16')
+            for _, _, run in self._runs:
+                positions = np.searchsorted(run, keys)
+                found = positions < len(run)
+                found[found] = run[positions[found]] == keys[found]
+                on_disk |= found
+        memory = self._memory
+        is_new = []
+        for digest, seen in zip(digests, on_disk):
+            if seen or digest in memory:
+                is_new.append(False)
+            else:
+                memory.add(digest)
+                is_new.append(True)
+        if len(memory) > self.max_in_memory:
+            self._spill()
+        return is_new
+
+    def _new_run_path(self):
+        if self._spill_dir is None:
+            self._spill_dir = tempfile.mkdtemp(prefix='csv_dedup_', dir=self._spill_parent)
+        self._run_counter += 1
+        return os.path.join(self._spill_dir, f"run_{self._run_counter:06d}.bin")
+
+    def _spill(self):
+        path = self._new_run_path()
+        np.array(sorted(self._memory), dtype='S16').tofile(path)
+        self.spilled += len(self._memory)
+        self._memory = set()
+        self._runs.append((0, path, np.memmap(path, dtype='S16', mode='r')))
+        self._compact()
+
+    def _compact(self):
+        while True:
+            levels = {}
+            for run in self._runs:
+                levels.setdefault(run[0], []).append(run)
+            full = [level for level, runs in levels.items() if len(runs) >= self.fanout]
+            if not full:
+                return
+            level = min(full)
+            group = levels[level]
+            path = self._new_run_path()
+            # Runs never share a digest, so a streaming merge is enough.
+            with open(path, 'wb') as f:
+                buffer = []
+                for digest in heapq.merge(*(_iter_run(run) for _, _, run in group)):
+                    buffer.append(digest)
+                    if len(buffer) >= 65536:
+                        f.write(b''.join(buffer))
+                        buffer = []
+                f.write(b''.join(buffer))
+            for _, old_path, _ in group:
+                os.remove(old_path)
+            self._runs = [run for run in self._runs if run[0] != level]
+            self._runs.append((level + 1, path, np.memmap(path, dtype='S16', mode='r')))
+
+    def close(self):
+        self._runs = []
+        self._memory = set()
+        if self._spill_dir is not None:
+            shutil.rmtree(self._spill_dir, ignore_errors=True)
+            self._spill_dir = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def _iter_run(run, block=65536):
+    for start in range(0, len(run), block):
+        data = run[start:start + block].tobytes()
+        for offset in range(0, len(data), 16):
+            yield data[offset:offset + 16]
+
+
+def _row_digest(row):
+    return hashlib.blake2b(repr(row).encode('utf-8'), digest_size=16).digest()
+
+
+def read_csv_header(file_path, encoding='utf-8-sig'):
+    """Returns the header row of a CSV file, or None if the file is empty."""
+    with open(file_path, 'r', newline='', encoding=encoding) as f:
+        header = next(csv.reader(f), None)
+    if header is not None and len(set(header)) != len(header):
+        raise ValueError(f"Duplicate column names in header of {file_path}: {header}")
+    return header
+
+
+def align_headers(headers, how='union'):
+    """
+    Computes the output columns for a list of headers.
+
+    Args:
+        headers (list): Header rows, one per file.
+        how (str): 'union' (all columns, in first-seen order, like pd.concat),
+                   'intersection' (columns present in every file) or 'strict'
+                   (every file must have the same set of columns).
+
+    Returns:
+        list: The output column names.
+    """
+    if not headers:
+        return []
+    if how == 'union':
+        columns = []
+        seen = set()
+        for header in headers:
+            for name in header:
+                if name not in seen:
+                    seen.add(name)
+                    columns.append(name)
+        return columns
+    if how == 'intersection':
+        common = set(headers[0]).intersection(*headers[1:])
+        return [name for name in headers[0] if name in common]
+    if how == 'strict':
+        for header in headers[1:]:
+            if set(header) != set(headers[0]):
+                raise ValueError(f"Header mismatch: {header} does not match {headers[0]}")
+        return list(headers[0])
+    raise ValueError("Invalid header mode. Choose 'union', 'intersection' or 'strict'.")
+
+
+def _row_aligner(header, columns):
+    """Returns a function mapping a row of `header` to the order of `columns`."""
+    if header == columns:
+        return lambda row: row
+    positions = {name: i for i, name in enumerate(header)}
+    indices = [positions.get(name, -1) for name in columns]
+    if -1 not in indices:
+        if len(indices) == 1:
+            index = indices[0]
+            return lambda row: [row[index]]
+        getter = operator.itemgetter(*indices)
+        return lambda row: list(getter(row))
+    return lambda row: [row[i] if i >= 0 else '' for i in indices]
+
+
+def iter_aligned_rows(file_path, columns, encoding='utf-8-sig'):
+    """
+    Yields the data rows of a CSV file reordered to `columns`. Missing columns are
+    empty, short rows are padded, and rows with more fields than the header raise
+    ValueError (pandas refuses those too).
+    """
+    with open(file_path, 'r', newline='', encoding=encoding) as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return
+        width = len(header)
+        align = _row_aligner(header, columns)
+        for row in reader:
+            if len(row) != width:
+                if not row:
+                    continue
+                if len(row) > width:
+                    raise ValueError(f"{file_path}, line {reader.line_num}: expected {width} fields, saw {len(row)}")
+                row = row + [''] * (width - len(row))
+            yield align(row)
+
+
+def merge_csv_files_streaming(input_files, output_file, drop_duplicates=False, header_mode='union',
+                              memory_budget=256 * 1024 * 1024, spill_dir=None, encoding='utf-8-sig'):
+    """
+    Merges CSV files row by row with bounded memory.
+
+    Files are read with the csv module and written to the output in batches, so only
+    one batch of rows is held at a time. Headers are aligned by name according to
+    header_mode (see align_headers). With drop_duplicates, rows are compared through
+    16-byte digests of their text in a RowDigestSet, which spills to spill_dir once
+    it exceeds memory_budget. Unlike pandas, values are compared as written, so "1"
+    and "1.0" are different.
+
+    Returns:
+        dict: Counts of files merged and skipped, rows read and written, and
+              duplicates dropped.
+    """
+    headers = []
+    readable = []
+    skipped = []
+    for file_path in input_files:
+        header = read_csv_header(file_path, encoding)
+        if header is None:
+            skipped.append(file_path)
+            continue
+        headers.append(header)
+        readable.append(file_path)
+    columns = align_headers(headers, header_mode)
+
+    stats = {'files_merged': len(readable), 'files_skipped': skipped, 'rows_read': 0,
+             'rows_written': 0, 'duplicates_dropped': 0, 'columns': columns}
+    digests = RowDigestSet(memory_budget, spill_dir) if drop_duplicates else None
+    tmp_path = output_file + '.tmp'
+    try:
+        with open(tmp_path, 'w', newline='', encoding='utf-8') as out:
+            writer = csv.writer(out)
+            writer.writerow(columns)
+            for file_path in readable:
+                batch = []
+                for row in iter_aligned_rows(file_path, columns, encoding):
+                    batch.append(row)
+                    if len(batch) >= STREAM_BATCH_ROWS:
+                        _write_batch(writer, batch, digests, stats)
+                        batch = []
+                if batch:
+                    _write_batch(writer, batch, digests, stats)
+        os.replace(tmp_path, output_file)
+    finally:
+        if digests is not None:
+            stats['digests_spilled'] = digests.spilled
+            digests.close()
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return stats
+
+
+def _write_batch(writer, batch, digests, stats):
+    stats['rows_read'] += len(batch)
+    if digests is not None:
+        is_new = digests.add_new([_row_digest(row) for row in batch])
+        kept = [row for row, new in zip(batch, is_new) if new]
+        stats['duplicates_dropped'] += len(batch) - len(kept)
+        batch = kept
+    writer.writerows(batch)
+    stats['rows_written'] += len(batch)
+
+
+def _merge_in_memory(input_files, output_file, drop_duplicates):
+    all_dataframes = []
+    print("\nReading CSV files...")
+    for file_path in input_files:
+        try:
+            df = pd.read_csv(file_path)
+            all_dataframes.append(df)
+            print(f"  Successfully read: {os.path.basename(file_path)}")
+        except FileNotFoundError:
+            print(f"  Error: File not found - {file_path}")
+        except pd.errors.EmptyDataError:
+            print(f"  Warning: File is empty - {file_path}. Skipping.")
+        except Exception as e:
+            print(f"  Error reading {file_path}: {e}")
+
+    if not all_dataframes:
+        print("No valid data to merge. Exiting.")
+        return
+
+    print("\nMerging dataframes...")
+    try:
+        merged_df = pd.concat(all_dataframes, ignore_index=True)
+        print("Dataframes merged successfully.")
+
+        if drop_duplicates:
+            initial_rows = len(merged_df)
+            merged_df.drop_duplicates(inplace=True)
+            rows_after_dedup = len(merged_df)
+            print(f"Dropped {initial_rows - rows_after_dedup} duplicate rows.")
+
+        print(f"\nSaving merged data to '{output_file}'...")
+        merged_df.to_csv(output_file, index=False)
+        print(f"Successfully saved merged data to '{output_file}'")
+        print(f"Total rows in merged file: {len(merged_df)}")
+
+    except Exception as e:
+        print(f"An error occurred during merging or saving: {e}")
+
+
+def _merge_streaming(input_files, output_file, drop_duplicates, **options):
+    print("\nStreaming CSV files...")
+    try:
+        stats = merge_csv_files_streaming(input_files, output_file, drop_duplicates, **options)
+    except (OSError, ValueError, csv.Error) as e:
+        print(f"An error occurred during merging or saving: {e}")
+        return
+    for file_path in stats['files_skipped']:
+        print(f"  Warning: File is empty - {file_path}. Skipping.")
+    if drop_duplicates:
+        print(f"Dropped {stats['duplicates_dropped']} duplicate rows.")
+    print(f"Successfully saved merged data to '{output_file}'")
+    print(f"Total rows in merged file: {stats['rows_written']}")
+
+
+MERGE_MODES = {
+    'memory': _merge_in_memory,
+    'streaming': _merge_streaming,
+}
+
+
+def merge_csv_files(input_files=None, output_file=None, drop_duplicates=None, mode='memory', **options):
+    """
+    Merges CSV files, prompting for any argument that is not given.
+
+    mode selects the implementation from MERGE_MODES: 'memory' loads everything
+    with pandas, 'streaming' uses merge_csv_files_streaming (options are passed
+    through to it).
+    """
+    if mode not in MERGE_MODES:
+        raise ValueError(f"Invalid mode. Choose one of: {', '.join(MERGE_MODES)}.")
+    print("--- CSV File Merger ---")
+
+    if input_files is None:
+        input_files = get_files_to_merge()
+    if not input_files:
+        print("No CSV files selected for merging. Exiting.")
+        return
+
+    if output_file is None:
+        output_file = get_output_filename()
+    if drop_duplicates is None:
+        drop_duplicates = get_drop_duplicates_option()
+
+    MERGE_MODES[mode](input_files, output_file, drop_duplicates, **options)
+
+# Additional implementation at 2026-10-20 20:26:03
+import os
+import collections
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:
+    pa = None
+
+_DIGEST_HASH_KEYS = ('mergecsvdigest01', 'mergecsvdigest02')
+_ARROW_TYPE_NAMES = {'Int64': 'int64', 'float64': 'float64', 'boolean': 'bool_', 'object': 'string'}
+
+
+def infer_csv_dtypes(input_files, columns, sample_rows=10_000):
+    """
+    Infers one dtype per output column from a sample spread over the input files,
+    so every file is parsed with the same schema.
+
+    Integers map to the nullable 'Int64' (a later file may have gaps), floats to
+    'float64', booleans to 'boolean' and everything else to 'object'.
+    """
+    if not input_files:
+        return {name: 'object' for name in columns}
+    per_file = max(100, sample_rows // len(input_files))
+    samples = []
+    for file_path in input_files:
+        try:
+            samples.append(pd.read_csv(file_path, nrows=per_file))
+        except pd.errors.EmptyDataError:
+            continue
+        if sum(len(sample) for sample in samples) >= sample_rows:
+            break
+    dtypes = {}
+    for name in columns:
+        # Judged per file: concatenating first would turn a column that some files
+        # lack into float or object before it is inspected.
+        kinds = {sample[name].dtype.kind for sample in samples if name in sample and sample[name].notna().any()}
+        if kinds and kinds <= set('iu'):
+            dtypes[name] = 'Int64'
+        elif kinds and kinds <= set('iuf'):
+            dtypes[name] = 'float64'
+        elif kinds == {'b'}:
+            dtypes[name] = 'boolean'
+        else:
+            dtypes[name] = 'object'
+    return dtypes
+
+
+def _mix64(h):
+    """splitmix64 finalizer, applied elementwise to a uint64 array."""
+    h = h ^ (h >> np.uint64(30))
+    h = h * np.uint64(0xBF58476D1CE4E5B9)
+    h = h ^ (h >> np.uint64(27))
+    h = h * np.uint64(0x94D049BB133111EB)
+    return h ^ (h >> np.uint64(31))
+
+
+def _frame_digests(df):
+    """
+    Packs two independent 64-bit row hashes into 16-byte digests.
+
+    hash_pandas_object only applies hash_key to object and string columns, so two
+    keys alone would give identical halves for numeric frames. The first half is
+    pandas' row hash; the second chains the per-column hashes (second key) through
+    _mix64, a different combiner, so the halves differ for every dtype.
+    """
+    first = pd.util.hash_pandas_object(df, index=False, hash_key=_DIGEST_HASH_KEYS[0]).to_numpy()
+    second = np.full(len(df), 0x9E3779B97F4A7C15, dtype=np.uint64)
+    for name in df.columns:
+        column = pd.util.hash_pandas_object(df[name], index=False, hash_key=_DIGEST_HASH_KEYS[1]).to_numpy()
+        second = _mix64(second ^ column)
+    return np.column_stack((first, second)).tobytes()
+
+
+def _parse_csv_task(task):
+    file_path, columns, dtypes, with_digests = task
+    header = read_csv_header(file_path)
+    if header is None:
+        return file_path, None, None
+    try:
+        df = pd.read_csv(file_path, dtype={name: dtypes[name] for name in header if name in dtypes})
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"{file_path} does not match the inferred dtypes ({e}); pass dtypes explicitly.") from e
+    df = df.reindex(columns=columns).astype(dtypes)
+    return file_path, df, _frame_digests(df) if with_digests else None
+
+
+def _ordered_parallel_map(executor, fn, items, window):
+    """
+    Like executor.map, but keeps at most window tasks in flight so a large input
+    is never submitted, or held in memory, all at once. Results come back in order.
+    """
+    pending = collections.deque()
+    for item in items:
+        pending.append(executor.submit(fn, item))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+class _CsvSink:
+    def __init__(self, path):
+        self._file = open(path, 'w', newline='', encoding='utf-8')
+        self._header = True
+
+    def write(self, df):
+        df.to_csv(self._file, header=self._header, index=False)
+        self._header = False
+
+    def close(self, columns):
+        if self._header:
+            self._file.write(','.join(columns) + '\n')
+        self._file.close()
+
+
+class _ArrowSink:
+    def __init__(self, path, dtypes, output_format):
+        if pa is None:
+            raise ImportError("pyarrow is required for Parquet/Feather output. Install it using: pip install pyarrow")
+        self.schema = pa.schema([(name, getattr(pa, _ARROW_TYPE_NAMES[dtype])()) for name, dtype in dtypes.items()])
+        if output_format == 'parquet':
+            self._writer = pa.parquet.ParquetWriter(path, self.schema)
+        else:
+            self._writer = pa.ipc.new_file(path, self.schema)
+
+    def write(self, df):
+        table = pa.Table.from_pandas(df, schema=self.schema, preserve_index=False)
+        self._writer.write_table(table)
+
+    def close(self, columns):
+        self._writer.close()
+
+
+def _output_format(output_file, output_format):
+    if output_format is None:
+        extension = os.path.splitext(output_file)[1].lower()
+        output_format = {'.parquet': 'parquet', '.feather': 'feather', '.arrow': 'feather'}.get(extension, 'csv')
+    if output_format not in ('csv', 'parquet', 'feather'):
+        raise ValueError("Invalid output format. Choose 'csv', 'parquet' or 'feather'.")
+    return output_format
+
+
+def merge_csv_files_parallel(input_files, output_file, drop_duplicates=False, header_mode='union', workers=None,
+                             dtypes=None, sample_rows=10_000, output_format=None,
+                             memory_budget=256 * 1024 * 1024, spill_dir=None):
+    """
+    Merges CSV files by parsing them concurrently in a process pool.
+
+    Column dtypes are inferred once from a sample (see infer_csv_dtypes) unless
+    given, so every worker produces frames with the same schema. Frames are written
+    in input order, with at most 2 * workers parsed files held at a time. Duplicates
+    are found from 128-bit hashes of the typed rows (computed in the workers), in a
+    RowDigestSet bounded by memory_budget, so '1' and '1.0' in a float column
+    match, as with pandas. output_format is 'csv', 'parquet' or 'feather' (taken
+    from the file extension when not given); the latter two need pyarrow.
+
+    Returns:
+        dict: Counts of files merged and skipped, rows read and written, duplicates
+              dropped, and the columns and dtypes used.
+    """
+    output_format = _output_format(output_file, output_format)
+    workers = workers or os.cpu_count() or 1
+    headers = {file_path: read_csv_header(file_path) for file_path in input_files}
+    readable = [file_path for file_path in input_files if headers[file_path] is not None]
+    columns = align_headers([headers[file_path] for file_path in readable], header_mode)
+    inferred = infer_csv_dtypes(readable, columns, sample_rows)
+    if dtypes:
+        unknown = [name for name in dtypes if name not in inferred]
+        if unknown:
+            raise ValueError(f"dtypes columns not found in merged header: {unknown}")
+        inferred.update(dtypes)
+    dtypes = inferred
+
+    stats = {'files_merged': 0, 'files_skipped': [f for f in input_files if headers[f] is None],
+             'rows_read': 0, 'rows_written': 0, 'duplicates_dropped': 0, 'columns': columns, 'dtypes': dtypes}
+    digests = RowDigestSet(memory_budget, spill_dir) if drop_duplicates else None
+    tmp_path = output_file + '.tmp'
+    try:
+        sink = _CsvSink(tmp_path) if output_format == 'csv' else _ArrowSink(tmp_path, dtypes, output_format)
+        tasks = [(file_path, columns, dtypes, drop_duplicates) for file_path in readable]
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                for file_path, df, blob in _ordered_parallel_map(executor, _parse_csv_task, tasks, 2 * workers):
+                    if df is None:
+                        stats['files_skipped'].append(file_path)
+                        continue
+                    stats['files_merged'] += 1
+                    stats['rows_read'] += len(df)
+                    if digests is not None:
+                        keys = [blob[offset:offset + 16] for offset in range(0, len(blob), 16)]
+                        keep = np.array(digests.add_new(keys), dtype=bool)
+                        stats['duplicates_dropped'] += int(len(df) - keep.sum())
+                        df = df[keep]
+                    sink.write(df)
+                    stats['rows_written'] += len(df)
+        finally:
+            sink.close(columns)
+        os.replace(tmp_path, output_file)
+    finally:
+        if digests is not None:
+            digests.close()
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return stats
+
+
+def _merge_parallel(input_files, output_file, drop_duplicates, **options):
+    print("\nParsing CSV files in parallel...")
+    try:
+        stats = merge_csv_files_parallel(input_files, output_file, drop_duplicates, **options)
+    except (OSError, ValueError, ImportError) as e:
+        print(f"An error occurred during merging or saving: {e}")
+        return
+    for file_path in stats['files_skipped']:
+        print(f"  Warning: File is empty - {file_path}. Skipping.")
+    if drop_duplicates:
+        print(f"Dropped {stats['duplicates_dropped']} duplicate rows.")
+    print(f"Successfully saved merged data to '{output_file}'")
+    print(f"Total rows in merged file: {stats['rows_written']}")
+
+
+MERGE_MODES['parallel'] = _merge_parallel
+
+
+# Additional implementation at 2026-10-20 21:14:40
+import csv
+import heapq
+import operator
+import os
+import shutil
+import tempfile
+
+# Estimated per-row and per-field overhead of a row held as a list of str.
+_ROW_OVERHEAD_BYTES = 72
+_FIELD_OVERHEAD_BYTES = 57
+MAX_MERGE_FANIN = 64
+
+
+def _key_converter(key_type):
+    """
+    Sort-key converter for one column; missing numbers sort last, as in sort_values.
+    NaN is rejected because it compares unequal to everything and would leave the
+    runs inconsistently ordered.
+    """
+    if key_type == 'str':
+        return None
+    cast = {'int': int, 'float': float}.get(key_type)
+    if cast is None:
+        raise ValueError("Invalid key type. Choose 'str', 'int' or 'float'.")
+
+    def convert(value):
+        if value == '':
+            return (1, 0)
+        number = cast(value)
+        if number != number:
+            raise ValueError(f"NaN is not a valid {key_type} sort key: {value!r}")
+        return (0, number)
+    return convert
+
+
+def _make_sort_key(columns, key_columns, key_types, by_row):
+    """
+    Builds the sort key for rows carrying their input sequence number as a final
+    field. Rows sort by key columns, then (if by_row) by the remaining values so
+    identical rows are adjacent, then by input order. The remaining values include
+    the raw text of int/float key columns: '1' and '01' convert to the same key,
+    and without the text as a tiebreak two identical '1' rows could be split by an
+    '01' row and escape dedup_on='row'.
+    """
+    positions = {name: i for i, name in enumerate(columns)}
+    missing = [name for name in key_columns if name not in positions]
+    if missing:
+        raise ValueError(f"Key columns not found in merged header: {missing}")
+    key_indices = [positions[name] for name in key_columns]
+    converters = [_key_converter(key_types.get(name, 'str')) for name in key_columns]
+    text_key_indices = [i for i, convert in zip(key_indices, converters) if convert is None]
+    rest_indices = [i for i in range(len(columns)) if i not in text_key_indices] if by_row else []
+
+    if not key_indices:
+        # No columns at all (every input empty): there is nothing to sort on.
+        key_part = lambda row: ()
+    elif not any(converters):
+        key_part = operator.itemgetter(*key_indices)
+    elif len(key_indices) == 1:
+        index, convert = key_indices[0], converters[0]
+        key_part = lambda row: convert(row[index])
+    else:
+        pairs = [(i, convert or str) for i, convert in zip(key_indices, converters)]
+        key_part = lambda row: tuple([convert(row[i]) for i, convert in pairs])
+    rest_part = operator.itemgetter(*rest_indices) if rest_indices else (lambda row: None)
+
+    def sort_key(row):
+        return key_part(row), rest_part(row), int(row[-1])
+    return sort_key
+
+
+class _RunWriter:
+    """Writes sorted runs of rows as CSV files in a temporary directory."""
+
+    def __init__(self, spill_dir=None):
+        self.directory = tempfile.mkdtemp(prefix='csv_sort_', dir=spill_dir)
+        self._counter = 0
+
+    def write(self, rows):
+        self._counter += 1
+        path = os.path.join(self.directory, f"run_{self._counter:06d}.csv")
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            csv.writer(f).writerows(rows)
+        return path
+
+    def close(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+
+def _iter_run_rows(path):
+    with open(path, 'r', newline='', encoding='utf-8') as f:
+        yield from csv.reader(f)
+
+
+def _merge_runs(paths, sort_key, runs):
+    """
+    Reduces the runs to at most MAX_MERGE_FANIN files with intermediate merge passes
+    and returns an iterator over all rows in sorted order.
+    """
+    while len(paths) > MAX_MERGE_FANIN:
+        merged_paths = []
+        for start in range(0, len(paths), MAX_MERGE_FANIN):
+            group = paths[start:start + MAX_MERGE_FANIN]
+            merged = heapq.merge(*(_iter_run_rows(path) for path in group), key=sort_key)
+            merged_paths.append(runs.write(merged))
+            for path in group:
+                os.remove(path)
+        paths = merged_paths
+    return heapq.merge(*(_iter_run_rows(path) for path in paths), key=sort_key)
+
+
+def merge_csv_files_sorted(input_files, output_file, key_columns=None, key_types=None, drop_duplicates=True,
+                           dedup_on='row', header_mode='union', memory_budget=256 * 1024 * 1024,
+                           spill_dir=None, encoding='utf-8-sig'):
+    """
+    Merges CSV files into output sorted by key columns, using an external merge sort.
+
+    Rows are read with the csv module and collected until memory_budget is reached;
+    each batch is sorted and written to disk as a run. The runs are then k-way merged
+    with heapq.merge (in several passes if there are more than MAX_MERGE_FANIN), and
+    duplicates are dropped as adjacent rows in the merged stream, so memory use does
+    not depend on the input size.
+
+    Args:
+        key_columns (list): Columns to sort by; all columns when None.
+        key_types (dict): Optional 'str', 'int' or 'float' per key column. Keys are
+                          compared as text by default.
+        drop_duplicates (bool): Drop duplicate rows (dedup_on='row') or keep only the
+                                first row in input order for each key (dedup_on='key').
+        Other arguments are as for merge_csv_files_streaming.
+
+    Returns:
+        dict: Counts of files merged and skipped, rows read and written, duplicates
+              dropped and runs written.
+    """
+    if dedup_on not in ('row', 'key'):
+        raise ValueError("Invalid dedup_on. Choose 'row' or 'key'.")
+    headers = []
+    readable = []
+    skipped = []
+    for file_path in input_files:
+        header = read_csv_header(file_path, encoding)
+        if header is None:
+            skipped.append(file_path)
+            continue
+        headers.append(header)
+        readable.append(file_path)
+    columns = align_headers(headers, header_mode)
+    key_columns = list(key_columns) if key_columns else list(columns)
+    sort_key = _make_sort_key(columns, key_columns, key_types or {}, drop_duplicates and dedup_on == 'row')
+    width = len(columns)
+    compare = (lambda row: row[:width]) if dedup_on == 'row' else (lambda row: sort_key(row)[0])
+
+    stats = {'files_merged': len(readable), 'files_skipped': skipped, 'rows_read': 0,
+             'rows_written': 0, 'duplicates_dropped': 0, 'runs': 0, 'columns': columns}
+    runs = _RunWriter(spill_dir)
+    tmp_path = output_file + '.tmp'
+    try:
+        paths = []
+        batch = []
+        batch_bytes = 0
+        sequence = 0
+        for file_path in readable:
+            for row in iter_aligned_rows(file_path, columns, encoding):
+                row.append(str(sequence))
+                sequence += 1
+                batch.append(row)
+                batch_bytes += _ROW_OVERHEAD_BYTES + _FIELD_OVERHEAD_BYTES * len(row) + sum(map(len, row))
+                if batch_bytes >= memory_budget:
+                    batch.sort(key=sort_key)
+                    paths.append(runs.write(batch))
+                    batch = []
+                    batch_bytes = 0
+        stats['rows_read'] = sequence
+        if batch:
+            batch.sort(key=sort_key)
+            if paths:
+                paths.append(runs.write(batch))
+        stats['runs'] = len(paths)
+        merged = _merge_runs(paths, sort_key, runs) if paths else iter(batch)
+
+        with open(tmp_path, 'w', newline='', encoding='utf-8') as out:
+            writer = csv.writer(out)
+            writer.writerow(columns)
+            previous = None
+            for row in merged:
+                if drop_duplicates:
+                    current = compare(row)
+                    if current == previous:
+                        stats['duplicates_dropped'] += 1
+                        continue
+                    previous = current
+                writer.writerow(row[:width])
+                stats['rows_written'] += 1
+        os.replace(tmp_path, output_file)
+    finally:
+        runs.close()
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return stats
+
+
+def _merge_external_sort(input_files, output_file, drop_duplicates, **options):
+    print("\nSorting CSV files on disk...")
+    try:
+        stats = merge_csv_files_sorted(input_files, output_file, drop_duplicates=drop_duplicates, **options)
+    except (OSError, ValueError, csv.Error) as e:
+        print(f"An error occurred during merging or saving: {e}")
+        return
+    for file_path in stats['files_skipped']:
+        print(f"  Warning: File is empty - {file_path}. Skipping.")
+    if drop_duplicates:
+        print(f"Dropped {stats['duplicates_dropped']} duplicate rows.")
+    print(f"Successfully saved merged data to '{output_file}'")
+    print(f"Total rows in merged file: {stats['rows_written']}")
+
+
+MERGE_MODES['external_sort'] = _merge_external_sort
+
+
 if __name__ == "__main__":
-    merge_csv_files()
\ No newline at end of file
+    merge_csv_files()
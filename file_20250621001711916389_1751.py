@@ -232,4 +232,651 @@ class ImageDuplicateFinder:
         elif method == 'perceptual_hash':
             return self.find_duplicates_perceptual_hash(hash_type)
         else:
-            raise ValueError("Invalid method. Choose 'pixel_comparison' or 'perceptual_hash'.")
\ No newline at end of file
+            raise ValueError("Invalid method. Choose 'pixel_comparison' or 'perceptual_hash'.")
+# Additional implementation at 2026-10-19 12:41:19
+import os
+import time
+import random
+import itertools
+
+
+def _hamming(a, b):
+    return bin(a ^ b).count("1")
+
+
+class BKTree:
+    """
+    Burkhard-Keller tree over integer hashes using Hamming distance.
+    Each node keeps the values of every item inserted with exactly its hash.
+    """
+
+    def __init__(self):
+        self.root = None
+
+    def add(self, key, value):
+        if self.root is None:
+            self.root = [key, [value], {}]
+            return
+        node = self.root
+        while True:
+            distance = _hamming(key, node[0])
+            if distance == 0:
+                node[1].append(value)
+                return
+            child = node[2].get(distance)
+            if child is None:
+                node[2][distance] = [key, [value], {}]
+                return
+            node = child
+
+    def query(self, key, radius):
+        """
+        Returns (distance, value) for every stored item within radius of key.
+        """
+        results = []
+        if self.root is None:
+            return results
+        stack = [self.root]
+        while stack:
+            node_key, values, children = stack.pop()
+            distance = _hamming(key, node_key)
+            if distance <= radius:
+                results.extend((distance, v) for v in values)
+            low, high = distance - radius, distance + radius
+            for child_distance, child in children.items():
+                if low <= child_distance <= high:
+                    stack.append(child)
+        return results
+
+
+class MultiIndexHammingIndex:
+    """
+    Multi-index hashing for Hamming range queries.
+
+    Hashes are split into num_blocks disjoint bit blocks, each with its own exact-match
+    table. If two hashes differ in at most radius bits, by the pigeonhole principle at
+    least one block differs in at most radius // num_blocks bits, so probing each table
+    with that small neighbourhood finds every candidate. Candidates are then checked
+    with the full Hamming distance.
+    """
+
+    def __init__(self, num_bits, radius, num_blocks=None):
+        if num_blocks is None:
+            num_blocks = max(1, min(radius + 1, num_bits // 21))
+        self.num_bits = num_bits
+        self.radius = radius
+        self.num_blocks = num_blocks
+        self.block_radius = radius // num_blocks
+        bounds = [round(i * num_bits / num_blocks) for i in range(num_blocks + 1)]
+        self.blocks = [(bounds[i], bounds[i + 1] - bounds[i]) for i in range(num_blocks)]
+        self.tables = [{} for _ in range(num_blocks)]
+        self.items = []
+        self._masks = {}
+
+    def _block_values(self, key):
+        return [(key >> shift) & ((1 << width) - 1) for shift, width in self.blocks]
+
+    def _neighbour_masks(self, width):
+        masks = self._masks.get(width)
+        if masks is None:
+            masks = [0]
+            for r in range(1, self.block_radius + 1):
+                for bits in itertools.combinations(range(width), r):
+                    mask = 0
+                    for bit in bits:
+                        mask |= 1 << bit
+                    masks.append(mask)
+            self._masks[width] = masks
+        return masks
+
+    def add(self, key, value):
+        item_id = len(self.items)
+        self.items.append((key, value))
+        for table, block_value in zip(self.tables, self._block_values(key)):
+            table.setdefault(block_value, []).append(item_id)
+        return item_id
+
+    def _candidate_ids(self, key):
+        candidates = set()
+        for (shift, width), table, block_value in zip(self.blocks, self.tables, self._block_values(key)):
+            for mask in self._neighbour_masks(width):
+                bucket = table.get(block_value ^ mask)
+                if bucket:
+                    candidates.update(bucket)
+        return candidates
+
+    def query(self, key, radius=None):
+        radius = self.radius if radius is None else radius
+        if radius > self.radius:
+            raise ValueError("Query radius cannot exceed the radius the index was built for.")
+        results = []
+        for item_id in self._candidate_ids(key):
+            item_key, value = self.items[item_id]
+            distance = _hamming(key, item_key)
+            if distance <= radius:
+                results.append((distance, value))
+        return results
+
+    def pairs_within_radius(self):
+        """
+        Yields (id_a, id_b, distance) for every pair of stored items with id_a < id_b
+        within the index radius.
+        """
+        for item_id, (key, _) in enumerate(self.items):
+            for other_id in self._candidate_ids(key):
+                if other_id <= item_id:
+                    continue
+                distance = _hamming(key, self.items[other_id][0])
+                if distance <= self.radius:
+                    yield item_id, other_id, distance
+
+
+def _group_pairs(num_items, pairs):
+    parent = list(range(num_items))
+
+    def find(x):
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    for a, b in pairs:
+        ra, rb = find(a), find(b)
+        if ra != rb:
+            parent[rb] = ra
+
+    groups = {}
+    for i in range(num_items):
+        groups.setdefault(find(i), []).append(i)
+    return [members for members in groups.values() if len(members) > 1]
+
+
+class IndexedImageDuplicateFinder(ImageDuplicateFinder):
+    """
+    ImageDuplicateFinder that computes each perceptual hash once and finds all pairs
+    within hash_threshold through a Hamming index instead of comparing every pair.
+    """
+
+    def compute_hashes(self, hash_type='phash'):
+        """
+        Returns a list of (path, int_hash) for every readable image in the directory.
+        """
+        image_paths = [os.path.join(self.directory, f) for f in sorted(os.listdir(self.directory))
+                       if f.lower().endswith(self.image_extensions) and os.path.isfile(os.path.join(self.directory, f))]
+        hashes = []
+        for path in image_paths:
+            img_hash = self._get_image_hash(path, hash_type)
+            if img_hash is not None:
+                hashes.append((path, int(str(img_hash), 16)))
+        return hashes
+
+    def group_hashes(self, hashes, index='multi_index'):
+        """
+        Groups (path, int_hash) entries whose hashes are within hash_threshold,
+        merging transitively connected images into one group.
+        """
+        num_bits = self.hash_size * self.hash_size
+        if index == 'multi_index':
+            mih = MultiIndexHammingIndex(num_bits, self.hash_threshold)
+            for i, (_, h) in enumerate(hashes):
+                mih.add(h, i)
+            pairs = ((a, b) for a, b, _ in mih.pairs_within_radius())
+        elif index == 'bktree':
+            tree = BKTree()
+            found = []
+            for i, (_, h) in enumerate(hashes):
+                found.extend((i, j) for _, j in tree.query(h, self.hash_threshold))
+                tree.add(h, i)
+            pairs = found
+        else:
+            raise ValueError("Invalid index. Choose 'multi_index' or 'bktree'.")
+
+        groups = _group_pairs(len(hashes), pairs)
+        return [[hashes[i][0] for i in members] for members in groups]
+
+    def find_duplicates_indexed(self, hash_type='phash', index='multi_index'):
+        """
+        Finds near-duplicate images using perceptual hashes and a Hamming index.
+        Returns a list of lists of paths, like find_duplicates_perceptual_hash.
+        """
+        return self.group_hashes(self.compute_hashes(hash_type), index=index)
+
+    def find_duplicates(self, method='indexed_hash', hash_type='phash'):
+        if method == 'indexed_hash':
+            return self.find_duplicates_indexed(hash_type)
+        return super().find_duplicates(method, hash_type)
+
+
+def benchmark_hash_index(num_hashes=100_000, num_bits=64, threshold=5, duplicate_fraction=0.05,
+                         baseline_sample=3000, seed=0):
+    """
+    Benchmarks all-pairs search over synthetic perceptual hashes with planted near-duplicates.
+
+    The multi-index search runs on all num_hashes. The BK-tree and pairwise baselines
+    are timed on the first baseline_sample hashes, and the pairwise time is
+    extrapolated quadratically to num_hashes since running it in full takes hours.
+    """
+    rng = random.Random(seed)
+    hashes = []
+    while len(hashes) < num_hashes:
+        h = rng.getrandbits(num_bits)
+        hashes.append(h)
+        if rng.random() < duplicate_fraction and len(hashes) < num_hashes:
+            near = h
+            for bit in rng.sample(range(num_bits), rng.randint(0, threshold)):
+                near ^= 1 << bit
+            hashes.append(near)
+
+    results = {}
+
+    t0 = time.perf_counter()
+    mih = MultiIndexHammingIndex(num_bits, threshold)
+    for i, h in enumerate(hashes):
+        mih.add(h, i)
+    mih_pairs = sum(1 for _ in mih.pairs_within_radius())
+    results["multi_index_seconds"] = time.perf_counter() - t0
+    results["multi_index_pairs"] = mih_pairs
+
+    sample = hashes[:baseline_sample]
+
+    t0 = time.perf_counter()
+    tree = BKTree()
+    bk_pairs = 0
+    for i, h in enumerate(sample):
+        bk_pairs += len(tree.query(h, threshold))
+        tree.add(h, i)
+    results["bktree_sample_seconds"] = time.perf_counter() - t0
+    results["bktree_sample_pairs"] = bk_pairs
+
+    t0 = time.perf_counter()
+    for i in range(len(sample)):
+        hi = sample[i]
+        for j in range(i + 1, len(sample)):
+            _hamming(hi, sample[j])
+    elapsed = time.perf_counter() - t0
+    results["pairwise_sample_seconds"] = elapsed
+    results["pairwise_seconds_estimated"] = elapsed * (num_hashes / len(sample)) ** 2
+    return results
+
+
+if __name__ == "__main__":
+    for name, value in benchmark_hash_index().items():
+        print(f"{name}: {value:.3f}" if isinstance(value, float) else f"{name}: {value}")
+
+# Additional implementation at 2026-10-19 14:03:52
+import os
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor
+from PIL import Image
+import imagehash
+
+_HASH_FUNCTIONS = {
+    'ahash': imagehash.average_hash,
+    'phash': imagehash.phash,
+    'dhash': imagehash.dhash,
+    'whash': imagehash.whash,
+}
+
+
+def _open_image_reduced(image_path, min_size):
+    """
+    Opens an image, asking the JPEG decoder to scale down by a power of two while
+    keeping both dimensions at least min_size. Other formats decode at full size.
+    """
+    img = Image.open(image_path)
+    if img.format == 'JPEG':
+        img.draft('RGB', min_size)
+    return img
+
+
+def get_image_signature_fast(image_path, size=(16, 16)):
+    """
+    Approximate version of get_image_signature: large JPEGs are decoded at reduced
+    resolution before the LANCZOS resize. The DCT-domain downscale changes pixel
+    values, so the bytes differ from get_image_signature for JPEGs, and a JPEG and a
+    PNG of the same picture no longer get equal signatures. Only use it where every
+    image goes through this function and approximate grouping is acceptable.
+    """
+    try:
+        with _open_image_reduced(image_path, (size[0] * 4, size[1] * 4)) as img:
+            img = img.convert("L")
+            img = img.resize(size, Image.Resampling.LANCZOS)
+            return img.tobytes()
+    except Exception:
+        return None
+
+
+def _compute_image_hash(image_path, hash_type='phash', hash_size=8):
+    hash_function = _HASH_FUNCTIONS.get(hash_type, imagehash.phash)
+    try:
+        with _open_image_reduced(image_path, (hash_size * 8, hash_size * 8)) as img:
+            return str(hash_function(img.convert("RGB"), hash_size=hash_size))
+    except Exception:
+        return None
+
+
+def _signature_task(task):
+    image_path, kind, params = task
+    if kind in ('signature', 'fast_signature'):
+        compute = get_image_signature if kind == 'signature' else get_image_signature_fast
+        signature = compute(image_path, params)
+        return signature.hex() if signature is not None else None
+    return _compute_image_hash(image_path, *params)
+
+
+class SignatureCache:
+    """
+    Persistent JSON cache of per-image signatures keyed by (path, size, mtime).
+    An entry is reused only while the file's size and mtime are unchanged.
+    """
+
+    def __init__(self, cache_path):
+        self.cache_path = cache_path
+        self.entries = {}
+        self.dirty = False
+        if cache_path and os.path.exists(cache_path):
+            try:
+                with open(cache_path, 'r', encoding='utf-8') as f:
+                    self.entries = json.load(f)
+            except (OSError, ValueError):
+                self.entries = {}
+
+    @staticmethod
+    def _stamp(image_path):
+        st = os.stat(image_path)
+        return [st.st_size, st.st_mtime_ns]
+
+    def get(self, image_path, key):
+        entry = self.entries.get(os.path.abspath(image_path))
+        if entry is None:
+            return None
+        try:
+            if entry["stamp"] != self._stamp(image_path):
+                return None
+        except OSError:
+            return None
+        return entry["values"].get(key)
+
+    def put(self, image_path, key, value):
+        abs_path = os.path.abspath(image_path)
+        stamp = self._stamp(image_path)
+        entry = self.entries.get(abs_path)
+        if entry is None or entry["stamp"] != stamp:
+            entry = {"stamp": stamp, "values": {}}
+            self.entries[abs_path] = entry
+        entry["values"][key] = value
+        self.dirty = True
+
+    def save(self):
+        if not self.cache_path or not self.dirty:
+            return
+        tmp_path = self.cache_path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f, separators=(',', ':'))
+        os.replace(tmp_path, self.cache_path)
+        self.dirty = False
+
+
+def extract_signatures(image_paths, kind='hash', params=('phash', 8), cache=None, workers=None, chunksize=8):
+    """
+    Computes signatures for image_paths on a process pool, reusing cached values.
+
+    kind is 'hash' (params = (hash_type, hash_size), values are hex strings),
+    'signature' (params = (width, height), values are hex-encoded grayscale bytes
+    from get_image_signature) or 'fast_signature' (the same from
+    get_image_signature_fast).
+    Returns {path: value} for every image that could be decoded.
+    """
+    params = tuple(params)
+    key = f"{kind}:{':'.join(str(p) for p in params)}"
+    results = {}
+    missing = []
+    for path in image_paths:
+        value = cache.get(path, key) if cache is not None else None
+        if value is not None:
+            results[path] = value
+        else:
+            missing.append(path)
+
+    if missing:
+        tasks = [(path, kind, params) for path in missing]
+        if workers == 1 or len(missing) == 1:
+            computed = list(map(_signature_task, tasks))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                computed = list(executor.map(_signature_task, tasks, chunksize=chunksize))
+        for path, value in zip(missing, computed):
+            if value is None:
+                continue
+            results[path] = value
+            if cache is not None:
+                try:
+                    cache.put(path, key, value)
+                except OSError:
+                    pass
+
+    if cache is not None:
+        cache.save()
+    return results
+
+
+def find_duplicate_images_cached(directory, cache_path=None, workers=None, size=(16, 16), fast=False):
+    """
+    Parallel, cached equivalent of find_duplicate_images. With fast=True signatures
+    come from get_image_signature_fast, which is quicker on large JPEGs but no longer
+    exact (see its docstring).
+    """
+    image_paths = []
+    for root, _, files in os.walk(directory):
+        for filename in files:
+            if filename.lower().endswith(('.png', '.jpg', '.jpeg', '.gif', '.bmp', '.tiff', '.webp')):
+                image_paths.append(os.path.join(root, filename))
+
+    cache = SignatureCache(cache_path) if cache_path else None
+    kind = 'fast_signature' if fast else 'signature'
+    signatures = extract_signatures(image_paths, kind=kind, params=size, cache=cache, workers=workers)
+
+    image_signatures = {}
+    for path in image_paths:
+        signature = signatures.get(path)
+        if signature is not None:
+            image_signatures.setdefault(signature, []).append(path)
+    return [paths for paths in image_signatures.values() if len(paths) > 1]
+
+
+class CachedImageDuplicateFinder(IndexedImageDuplicateFinder):
+    """
+    IndexedImageDuplicateFinder whose hashes are extracted on a process pool and
+    kept in a persistent SignatureCache between runs.
+    """
+
+    def __init__(self, directory, cache_path=None, workers=None, **kwargs):
+        super().__init__(directory, **kwargs)
+        self.cache = SignatureCache(cache_path) if cache_path else None
+        self.workers = workers
+
+    def compute_hashes(self, hash_type='phash'):
+        image_paths = [os.path.join(self.directory, f) for f in sorted(os.listdir(self.directory))
+                       if f.lower().endswith(self.image_extensions) and os.path.isfile(os.path.join(self.directory, f))]
+        values = extract_signatures(image_paths, kind='hash', params=(hash_type, self.hash_size),
+                                    cache=self.cache, workers=self.workers)
+        return [(path, int(values[path], 16)) for path in image_paths if path in values]
+
+
+def benchmark_signature_extraction(directory, cache_path, workers=None):
+    """
+    Times serial get_image_signature against parallel extraction of the same exact
+    signatures with a cold and then a warm cache, and against parallel
+    reduced-resolution (fast) extraction. The cache file is removed first.
+    """
+    image_paths = []
+    for root, _, files in os.walk(directory):
+        for filename in files:
+            if filename.lower().endswith(('.png', '.jpg', '.jpeg', '.gif', '.bmp', '.tiff', '.webp')):
+                image_paths.append(os.path.join(root, filename))
+    if os.path.exists(cache_path):
+        os.remove(cache_path)
+
+    t0 = time.perf_counter()
+    for path in image_paths:
+        get_image_signature(path)
+    serial = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    extract_signatures(image_paths, kind='signature', params=(16, 16), cache=SignatureCache(cache_path), workers=workers)
+    cold = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    extract_signatures(image_paths, kind='signature', params=(16, 16), cache=SignatureCache(cache_path), workers=workers)
+    warm = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    extract_signatures(image_paths, kind='fast_signature', params=(16, 16), workers=workers)
+    fast = time.perf_counter() - t0
+
+    return {"images": len(image_paths), "serial_seconds": serial,
+            "parallel_cold_seconds": cold, "cached_seconds": warm, "parallel_fast_seconds": fast}
+
+# Additional implementation at 2026-10-19 15:16:44
+import os
+import time
+import numpy as np
+from PIL import Image
+
+
+def image_to_array(img):
+    """
+    Converts a PIL image to a float32 NumPy array of shape (height, width, channels).
+    """
+    arr = np.asarray(img, dtype=np.float32)
+    if arr.ndim == 2:
+        arr = arr[:, :, None]
+    return arr
+
+
+def mse_one_to_many(reference, candidates):
+    """
+    Mean squared error between one image array (H, W, C) and a stack of image
+    arrays (N, H, W, C). Returns an array of N scores.
+    """
+    diff = candidates.astype(np.float32) - reference.astype(np.float32)
+    return np.einsum('nhwc,nhwc->n', diff, diff) / reference.size
+
+
+def ssim_one_to_many(reference, candidates, data_range=255.0):
+    """
+    Global (single-window) SSIM between one image array and a stack of image arrays,
+    computed on luminance. Returns an array of N scores in [-1, 1].
+    """
+    c1 = (0.01 * data_range) ** 2
+    c2 = (0.03 * data_range) ** 2
+    ref = reference.astype(np.float32).mean(axis=-1).ravel()
+    cand = candidates.astype(np.float32).mean(axis=-1).reshape(len(candidates), -1)
+
+    mu_x = ref.mean()
+    mu_y = cand.mean(axis=1)
+    ref_centered = ref - mu_x
+    cand_centered = cand - mu_y[:, None]
+    var_x = ref_centered @ ref_centered / ref.size
+    var_y = np.einsum('ij,ij->i', cand_centered, cand_centered) / ref.size
+    cov = cand_centered @ ref_centered / ref.size
+
+    return ((2 * mu_x * mu_y + c1) * (2 * cov + c2)) / ((mu_x ** 2 + mu_y ** 2 + c1) * (var_x + var_y + c2))
+
+
+class VectorizedImageDuplicateFinder(ImageDuplicateFinder):
+    """
+    ImageDuplicateFinder whose pixel comparison runs on NumPy arrays. Each image is
+    decoded and converted once, then compared against all later images in one
+    batched operation instead of a per-pixel Python loop.
+    """
+
+    def __init__(self, directory, batch_size=256, **kwargs):
+        super().__init__(directory, **kwargs)
+        self.batch_size = batch_size
+
+    def _compare_pixels_mse(self, img1, img2):
+        if img1.size != img2.size or img1.mode != img2.mode:
+            return float('inf')
+        a = image_to_array(img1)
+        b = image_to_array(img2)
+        return float(mse_one_to_many(a, b[None])[0])
+
+    def _load_arrays(self):
+        image_paths = [os.path.join(self.directory, f) for f in sorted(os.listdir(self.directory))
+                       if f.lower().endswith(self.image_extensions) and os.path.isfile(os.path.join(self.directory, f))]
+        by_shape = {}
+        for path in image_paths:
+            img = self._load_and_preprocess_image(path, for_pixel_comparison=True)
+            if img is not None:
+                by_shape.setdefault(img.size, []).append((path, np.asarray(img, dtype=np.uint8)))
+        return by_shape
+
+    def compare_one_to_many(self, reference, candidates, metric='mse'):
+        """
+        Scores one uint8 image array against a (N, H, W, C) stack in batches.
+        """
+        score_fn = mse_one_to_many if metric == 'mse' else ssim_one_to_many
+        ref = reference.astype(np.float32)
+        scores = np.empty(len(candidates), dtype=np.float64)
+        for start in range(0, len(candidates), self.batch_size):
+            batch = candidates[start:start + self.batch_size]
+            scores[start:start + len(batch)] = score_fn(ref, batch)
+        return scores
+
+    def find_duplicates_pixel_comparison(self, metric='mse', ssim_threshold=0.98):
+        """
+        Same result format as ImageDuplicateFinder.find_duplicates_pixel_comparison.
+        With metric='ssim', images are duplicates when global SSIM >= ssim_threshold.
+        """
+        duplicates = {}
+        for entries in self._load_arrays().values():
+            paths = [path for path, _ in entries]
+            stack = np.stack([arr if arr.ndim == 3 else arr[:, :, None] for _, arr in entries])
+            for i in range(len(paths) - 1):
+                scores = self.compare_one_to_many(stack[i], stack[i + 1:], metric)
+                if metric == 'mse':
+                    hits = np.nonzero(scores <= self.pixel_comparison_threshold)[0]
+                else:
+                    hits = np.nonzero(scores >= ssim_threshold)[0]
+                if len(hits):
+                    duplicates[paths[i]] = [paths[i + 1 + j] for j in hits]
+        return duplicates
+
+
+def benchmark_pixel_comparison(size=(256, 256), num_candidates=200, seed=0):
+    """
+    Times the per-pixel Python MSE loop against the NumPy backend for a single pair
+    and for one-vs-many comparisons at the given size.
+    """
+    rng = np.random.default_rng(seed)
+    width, height = size
+    candidates = rng.integers(0, 256, size=(num_candidates, height, width, 3), dtype=np.uint8)
+    reference = candidates[0]
+    img1 = Image.fromarray(reference, 'RGB')
+    img2 = Image.fromarray(candidates[1], 'RGB')
+
+    loop_finder = ImageDuplicateFinder.__new__(ImageDuplicateFinder)
+    t0 = time.perf_counter()
+    loop_mse = loop_finder._compare_pixels_mse(img1, img2)
+    loop_pair = time.perf_counter() - t0
+
+    vec_finder = VectorizedImageDuplicateFinder.__new__(VectorizedImageDuplicateFinder)
+    vec_finder.batch_size = 64
+    t0 = time.perf_counter()
+    vec_mse = vec_finder._compare_pixels_mse(img1, img2)
+    vec_pair = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    vec_finder.compare_one_to_many(reference, candidates)
+    vec_many = time.perf_counter() - t0
+
+    return {
+        "loop_pair_seconds": loop_pair,
+        "numpy_pair_seconds": vec_pair,
+        "pair_speedup": loop_pair / vec_pair,
+        "numpy_one_to_many_seconds": vec_many,
+        "one_to_many_speedup": loop_pair * num_candidates / vec_many,
+        "mse_agrees": abs(loop_mse - vec_mse) < 1e-3 * max(1.0, loop_mse),
+    }
@@ -354,4 +354,228 @@ if __name__ == "__main__":
     result_custom_threshold = detect_skewness(data_custom_threshold, threshold=0.1, title="Data with Custom Threshold")
     print(result_custom_threshold)
 
-    print("\n--- End of Program ---")
\ No newline at end of file
+    print("\n--- End of Program ---")
+# Additional implementation at 2026-10-20 18:47:09
+import math
+import numpy as np
+import pandas as pd
+import matplotlib.pyplot as plt
+
+
+def _numeric_chunk(chunk):
+    """Coerces a chunk to a float array and drops NaN/non-numeric values, as detect_skewness does."""
+    if isinstance(chunk, np.ndarray) and np.issubdtype(chunk.dtype, np.number):
+        values = chunk.astype(float, copy=False).ravel()
+    else:
+        values = pd.to_numeric(pd.Series(chunk), errors='coerce').to_numpy(dtype=float)
+    return values[~np.isnan(values)]
+
+
+class MomentAccumulator:
+    """
+    Accumulates count, mean and the 2nd-4th central moment sums over chunks.
+
+    Each chunk's central sums are computed with NumPy and combined with the running
+    totals using the pairwise update formulas of Chan et al. / Pébay, so data of any
+    size is processed in one pass without loss of precision from raw power sums.
+    Accumulators from different chunks, files or workers can be merged.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.m3 = 0.0
+        self.m4 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def update(self, chunk):
+        """Adds a chunk of values (list, array or Series); NaN and non-numeric values are skipped."""
+        values = _numeric_chunk(chunk)
+        if values.size == 0:
+            return self
+        other = MomentAccumulator()
+        other.count = int(values.size)
+        other.mean = float(values.mean())
+        deviations = values - other.mean
+        squared = deviations * deviations
+        other.m2 = float(squared.sum())
+        other.m3 = float((squared * deviations).sum())
+        other.m4 = float((squared * squared).sum())
+        other.min = float(values.min())
+        other.max = float(values.max())
+        return self.merge(other)
+
+    def merge(self, other):
+        """Folds another accumulator into this one in place and returns self."""
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.__dict__.update(other.__dict__)
+            return self
+        na, nb = self.count, other.count
+        n = na + nb
+        delta = other.mean - self.mean
+        delta_n = delta / n
+        m2 = self.m2 + other.m2 + delta * delta_n * na * nb
+        m3 = (self.m3 + other.m3
+              + delta * delta_n * delta_n * na * nb * (na - nb)
+              + 3 * delta_n * (na * other.m2 - nb * self.m2))
+        m4 = (self.m4 + other.m4
+              + delta * delta_n ** 3 * na * nb * (na * na - na * nb + nb * nb)
+              + 6 * delta_n * delta_n * (na * na * other.m2 + nb * nb * self.m2)
+              + 4 * delta_n * (na * other.m3 - nb * self.m3))
+        self.count = n
+        self.mean += delta_n * nb
+        self.m2, self.m3, self.m4 = m2, m3, m4
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    def variance(self, ddof=0):
+        return self.m2 / (self.count - ddof) if self.count > ddof else float('nan')
+
+    def skewness(self):
+        """Biased sample skewness, matching scipy.stats.skew's default."""
+        if self.count < 2 or self.m2 == 0:
+            return float('nan')
+        return math.sqrt(self.count) * self.m3 / self.m2 ** 1.5
+
+    def kurtosis(self, fisher=True):
+        """Biased sample kurtosis, matching scipy.stats.kurtosis's default (excess when fisher=True)."""
+        if self.count < 2 or self.m2 == 0:
+            return float('nan')
+        value = self.count * self.m4 / (self.m2 * self.m2)
+        return value - 3.0 if fisher else value
+
+
+class StreamingHistogram:
+    """
+    Fixed-size histogram whose range grows as data arrives.
+
+    The range starts at the span of the first chunk. When later values fall outside
+    it, the bin width is doubled and adjacent bins are merged pairwise until the
+    range covers them, so no value is re-read or dropped and memory stays at `bins`
+    counters. A value lying exactly on an edge may land one bin off np.histogram.
+    """
+
+    def __init__(self, bins=50):
+        if bins < 2 or bins % 2:
+            raise ValueError("bins must be an even number of at least 2.")
+        self.bins = bins
+        self.counts = np.zeros(bins, dtype=np.int64)
+        self.low = None
+        self.width = None
+
+    def update(self, chunk):
+        values = _numeric_chunk(chunk)
+        if values.size == 0:
+            return self
+        low, high = float(values.min()), float(values.max())
+        if self.low is None:
+            self.low = low
+            self.width = (high - low) / self.bins if high > low else 1.0
+        while low < self.low:
+            span = self.width * self.bins
+            self.counts = np.concatenate((np.zeros(self.bins // 2, dtype=np.int64),
+                                          self.counts.reshape(-1, 2).sum(axis=1)))
+            self.low -= span
+            self.width *= 2
+        # As in np.histogram, the last bin includes its upper edge.
+        while high > self.low + self.width * self.bins:
+            self.counts = np.concatenate((self.counts.reshape(-1, 2).sum(axis=1),
+                                          np.zeros(self.bins // 2, dtype=np.int64)))
+            self.width *= 2
+        index = np.searchsorted(self.edges, values, side='right') - 1
+        np.clip(index, 0, self.bins - 1, out=index)
+        self.counts += np.bincount(index, minlength=self.bins)
+        return self
+
+    @property
+    def edges(self):
+        if self.low is None:
+            return np.empty(0)
+        return self.low + self.width * np.arange(self.bins + 1)
+
+
+def detect_skewness_chunked(chunks, plot_histogram=False, threshold=0.5, bins=50, title="Data Skewness Analysis"):
+    """
+    Streaming counterpart of detect_skewness for data that does not fit in memory.
+
+    Args:
+        chunks (iterable): Chunks of numerical data (lists, arrays or Series).
+        plot_histogram (bool): If True, plot the incrementally built histogram.
+        threshold (float): Absolute skewness above which data is considered skewed.
+        bins (int): Number of histogram bins (even).
+        title (str): Title for the plot if plot_histogram is True.
+
+    Returns:
+        dict: The same keys as detect_skewness, plus 'kurtosis', 'mean', 'std_dev',
+              'histogram_counts' and 'histogram_edges'.
+    """
+    moments = MomentAccumulator()
+    histogram = StreamingHistogram(bins)
+    for chunk in chunks:
+        values = _numeric_chunk(chunk)
+        moments.update(values)
+        histogram.update(values)
+
+    result = {
+        'skewness_coefficient': np.nan,
+        'skewness_type': '',
+        'is_skewed': False,
+        'data_points': moments.count,
+        'kurtosis': np.nan,
+        'mean': moments.mean if moments.count else np.nan,
+        'std_dev': math.sqrt(moments.variance()) if moments.count else np.nan,
+        'histogram_counts': histogram.counts,
+        'histogram_edges': histogram.edges,
+    }
+    if moments.count < 2:
+        result['skewness_type'] = 'Not enough data'
+        return result
+    if moments.m2 == 0:
+        result['skewness_type'] = 'Undefined (constant data)'
+        return result
+
+    skew_value = moments.skewness()
+    result['skewness_coefficient'] = skew_value
+    result['kurtosis'] = moments.kurtosis()
+    if abs(skew_value) < threshold:
+        result['skewness_type'] = 'Symmetric'
+    elif skew_value > threshold:
+        result['skewness_type'] = 'Positively skewed (right-skewed)'
+        result['is_skewed'] = True
+    else:
+        result['skewness_type'] = 'Negatively skewed (left-skewed)'
+        result['is_skewed'] = True
+
+    if plot_histogram:
+        plt.figure(figsize=(10, 6))
+        plt.stairs(histogram.counts, histogram.edges, fill=True, edgecolor='black', alpha=0.7)
+        plt.title(f"{title}\nSkewness: {skew_value:.4f} ({result['skewness_type']})")
+        plt.xlabel('Value')
+        plt.ylabel('Frequency')
+        plt.grid(True, linestyle='--', alpha=0.6)
+        plt.axvline(moments.mean, color='red', linestyle='dashed', linewidth=1, label=f'Mean: {moments.mean:.2f}')
+        plt.legend()
+        plt.show()
+
+    return result
+
+
+def detect_skewness_from_csv(filepath, column, chunksize=1_000_000, **kwargs):
+    """
+    Runs detect_skewness_chunked over one column of a CSV file, reading chunksize
+    rows at a time. Extra keyword arguments are passed to detect_skewness_chunked.
+    """
+    reader = pd.read_csv(filepath, usecols=[column], chunksize=chunksize)
+    return detect_skewness_chunked((chunk[column] for chunk in reader), **kwargs)
+
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(0)
+    chunks = (rng.lognormal(mean=0, sigma=0.5, size=1_000_000) for _ in range(10))
+    result = detect_skewness_chunked(chunks)
+    print({key: value for key, value in result.items() if not key.startswith('histogram')})
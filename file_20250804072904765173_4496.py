@@ -94,4 +94,510 @@ class RollingFrequencyCounter:
         Clears all items and resets the counter.
         """
         self.window_data.clear()
-        self.frequencies.clear()
\ No newline at end of file
+        self.frequencies.clear()
+# Additional implementation at 2026-10-20 12:08:57
+import collections
+import heapq
+import itertools
+import math
+import time
+from operator import itemgetter
+
+import numpy as np
+
+
+class _TimeBucketRing:
+    """
+    Shared ring-of-buckets bookkeeping: maps timestamps to slots and expires slots
+    as the window moves forward. Subclasses store per-bucket state and implement
+    add_items() and _expire_bucket(slot).
+    """
+
+    def __init__(self, window_duration_seconds, num_buckets):
+        if not isinstance(window_duration_seconds, (int, float)) or window_duration_seconds <= 0:
+            raise ValueError("Window duration must be a positive number.")
+        if num_buckets < 1:
+            raise ValueError("num_buckets must be at least 1.")
+        self.window_duration = window_duration_seconds
+        self.num_buckets = num_buckets
+        self.bucket_width = window_duration_seconds / num_buckets
+        self.current_bucket = None
+        self.total = 0
+
+    def _slot_for(self, timestamp):
+        """
+        Advances the ring to timestamp and returns its slot, or None if the timestamp
+        is older than the window.
+        """
+        bucket_index = math.floor(timestamp / self.bucket_width)
+        if self.current_bucket is None:
+            self.current_bucket = bucket_index
+        elif bucket_index > self.current_bucket:
+            expired = min(bucket_index - self.current_bucket, self.num_buckets)
+            for offset in range(1, expired + 1):
+                self._expire_bucket((self.current_bucket + offset) % self.num_buckets)
+            self.current_bucket = bucket_index
+        elif bucket_index <= self.current_bucket - self.num_buckets:
+            return None
+        return bucket_index % self.num_buckets
+
+    def add_item(self, item, timestamp):
+        self.add_items((item,), timestamp)
+
+    def advance(self, timestamp):
+        """
+        Expires buckets that have left the window as of timestamp without adding items.
+        """
+        self._slot_for(timestamp)
+
+    def total_items_in_window(self):
+        return self.total
+
+
+class BucketedRollingFrequencyCounter(_TimeBucketRing):
+    """
+    Exact rolling counts kept in a ring of time buckets instead of one deque entry
+    per event. Memory grows with the number of distinct items per bucket, not with
+    the event rate, and the window advances one bucket at a time, so its edge is
+    accurate to window_duration / num_buckets.
+    """
+
+    def __init__(self, window_duration_seconds, num_buckets=60):
+        super().__init__(window_duration_seconds, num_buckets)
+        self.buckets = [collections.Counter() for _ in range(num_buckets)]
+        self.frequencies = collections.Counter()
+
+    def _expire_bucket(self, slot):
+        bucket = self.buckets[slot]
+        frequencies = self.frequencies
+        for item, count in bucket.items():
+            remaining = frequencies[item] - count
+            if remaining:
+                frequencies[item] = remaining
+            else:
+                del frequencies[item]
+            self.total -= count
+        bucket.clear()
+
+    def add_item(self, item, timestamp):
+        if not isinstance(timestamp, (int, float)):
+            raise TypeError("Timestamp must be a number.")
+        slot = self._slot_for(timestamp)
+        if slot is None:
+            return
+        self.buckets[slot][item] += 1
+        self.frequencies[item] += 1
+        self.total += 1
+
+    def add_items(self, items, timestamp):
+        """
+        Adds a batch of items that share one timestamp; much faster than calling
+        add_item per event because counting happens in C.
+        """
+        if not isinstance(timestamp, (int, float)):
+            raise TypeError("Timestamp must be a number.")
+        slot = self._slot_for(timestamp)
+        if slot is None:
+            return
+        batch = collections.Counter(items)
+        self.buckets[slot].update(batch)
+        self.frequencies.update(batch)
+        self.total += sum(batch.values())
+
+    def get_count(self, item):
+        return self.frequencies.get(item, 0)
+
+    def top_k(self, k):
+        """
+        The k most frequent items as (item, count) pairs, selected with a heap
+        over the live table rather than a sorted copy of it.
+        """
+        return heapq.nlargest(k, self.frequencies.items(), key=itemgetter(1))
+
+    def most_common(self, n=None):
+        if n is None:
+            return self.frequencies.most_common()
+        return self.top_k(n)
+
+    def clear(self):
+        for bucket in self.buckets:
+            bucket.clear()
+        self.frequencies.clear()
+        self.current_bucket = None
+        self.total = 0
+
+
+class _SpaceSavingTable:
+    """
+    Space-Saving summary (Metwally et al.) of at most `capacity` items. When a new
+    item arrives at a full table it evicts the entry with the smallest count and
+    inherits that count, so counts[item] never undercounts and overcounts by at
+    most errors[item]. The minimum is found through a heap with lazy deletion.
+    """
+
+    def __init__(self, capacity):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1.")
+        self.capacity = capacity
+        self.counts = {}
+        self.errors = {}
+        self._heap = []
+        self._tiebreak = itertools.count()
+
+    def _push(self, item, count):
+        heapq.heappush(self._heap, (count, next(self._tiebreak), item))
+        if len(self._heap) > 4 * self.capacity:
+            self._heap = [(c, next(self._tiebreak), i) for i, c in self.counts.items()]
+            heapq.heapify(self._heap)
+
+    def _pop_min(self):
+        counts = self.counts
+        while True:
+            count, _, item = heapq.heappop(self._heap)
+            if counts.get(item) == count:
+                return item, count
+
+    def update(self, batch):
+        """
+        Adds a mapping of item -> count (weighted Space-Saving).
+        """
+        counts = self.counts
+        errors = self.errors
+        for item, count in batch.items():
+            if item in counts:
+                counts[item] += count
+            elif len(counts) < self.capacity:
+                counts[item] = count
+                errors[item] = 0
+            else:
+                victim, floor = self._pop_min()
+                del counts[victim]
+                del errors[victim]
+                counts[item] = floor + count
+                errors[item] = floor
+            self._push(item, counts[item])
+
+    def __iter__(self):
+        return iter(self.counts)
+
+    def __len__(self):
+        return len(self.counts)
+
+    def clear(self):
+        self.counts.clear()
+        self.errors.clear()
+        self._heap.clear()
+
+
+class SketchRollingFrequencyCounter(_TimeBucketRing):
+    """
+    Approximate heavy hitters over a rolling window in fixed memory.
+
+    Each bucket holds a Count-Min Sketch (depth x width counters) and a Space-Saving
+    table of at most `capacity` candidate items. A running sum of the bucket
+    sketches answers point queries for the whole window; top_k() ranks the union of
+    the bucket candidates by that estimate. Estimates never undercount and exceed
+    the true count by at most e * N / width with probability 1 - exp(-depth),
+    where N is the number of events in the window.
+    """
+
+    _PRIME = (1 << 31) - 1
+
+    def __init__(self, window_duration_seconds, num_buckets=60, width=2048, depth=4, capacity=256, seed=0):
+        super().__init__(window_duration_seconds, num_buckets)
+        self.width = width
+        self.depth = depth
+        self.capacity = capacity
+        rng = np.random.default_rng(seed)
+        self._hash_a = rng.integers(1, self._PRIME, size=depth, dtype=np.int64)
+        self._hash_b = rng.integers(0, self._PRIME, size=depth, dtype=np.int64)
+        self._rows = np.arange(depth)
+        self.sketches = np.zeros((num_buckets, depth, width), dtype=np.int64)
+        self.window_sketch = np.zeros((depth, width), dtype=np.int64)
+        self.candidates = [_SpaceSavingTable(capacity) for _ in range(num_buckets)]
+        self.bucket_totals = [0] * num_buckets
+
+    def _columns(self, items):
+        hashes = np.fromiter((hash(item) & 0x7FFFFFFF for item in items), dtype=np.int64, count=len(items))
+        return ((hashes[:, None] * self._hash_a + self._hash_b) % self._PRIME) % self.width
+
+    def _expire_bucket(self, slot):
+        self.window_sketch -= self.sketches[slot]
+        self.sketches[slot] = 0
+        self.candidates[slot].clear()
+        self.total -= self.bucket_totals[slot]
+        self.bucket_totals[slot] = 0
+
+    def add_items(self, items, timestamp):
+        if not isinstance(timestamp, (int, float)):
+            raise TypeError("Timestamp must be a number.")
+        slot = self._slot_for(timestamp)
+        if slot is None:
+            return
+        batch = collections.Counter(items)
+        if not batch:
+            return
+        keys = list(batch)
+        counts = np.fromiter(batch.values(), dtype=np.int64, count=len(keys))
+        columns = self._columns(keys)
+        for row in range(self.depth):
+            np.add.at(self.sketches[slot, row], columns[:, row], counts)
+            np.add.at(self.window_sketch[row], columns[:, row], counts)
+        batch_total = int(counts.sum())
+        self.bucket_totals[slot] += batch_total
+        self.total += batch_total
+        self.candidates[slot].update(batch)
+
+    def get_count(self, item):
+        columns = self._columns([item])[0]
+        return int(self.window_sketch[self._rows, columns].min())
+
+    def top_k(self, k):
+        candidates = set()
+        for table in self.candidates:
+            candidates.update(table)
+        if not candidates:
+            return []
+        keys = list(candidates)
+        columns = self._columns(keys)
+        estimates = self.window_sketch[self._rows, columns].min(axis=1)
+        if k < len(keys):
+            best = np.argpartition(-estimates, k - 1)[:k]
+        else:
+            best = np.arange(len(keys))
+        best = best[np.argsort(-estimates[best], kind='stable')]
+        return [(keys[i], int(estimates[i])) for i in best]
+
+    def most_common(self, n=None):
+        return self.top_k(self.capacity if n is None else n)
+
+    def clear(self):
+        self.sketches[:] = 0
+        self.window_sketch[:] = 0
+        for table in self.candidates:
+            table.clear()
+        self.bucket_totals = [0] * self.num_buckets
+        self.current_bucket = None
+        self.total = 0
+
+
+def benchmark_frequency_counters(num_events=1_000_000, num_items=100_000, batch_size=10_000, seed=0):
+    """
+    Feeds a Zipf-distributed stream through the deque-based counter, the exact
+    bucketed counter and the sketch counter, reporting events per second and
+    whether the sketch's top 10 matches the exact one.
+    """
+    rng = np.random.default_rng(seed)
+    stream = (rng.zipf(1.3, size=num_events) % num_items).tolist()
+    batches = [stream[i:i + batch_size] for i in range(0, num_events, batch_size)]
+    seconds_per_batch = 1.0
+    results = {}
+
+    legacy = RollingFrequencyCounter(60)
+    t0 = time.perf_counter()
+    for b, batch in enumerate(batches):
+        for item in batch:
+            legacy.add_item(item, b * seconds_per_batch)
+    results["deque_events_per_second"] = num_events / (time.perf_counter() - t0)
+
+    exact = BucketedRollingFrequencyCounter(60, num_buckets=60)
+    t0 = time.perf_counter()
+    for b, batch in enumerate(batches):
+        exact.add_items(batch, b * seconds_per_batch)
+    results["bucketed_events_per_second"] = num_events / (time.perf_counter() - t0)
+
+    sketch = SketchRollingFrequencyCounter(60, num_buckets=60)
+    t0 = time.perf_counter()
+    for b, batch in enumerate(batches):
+        sketch.add_items(batch, b * seconds_per_batch)
+    results["sketch_events_per_second"] = num_events / (time.perf_counter() - t0)
+
+    t0 = time.perf_counter()
+    sketch_top = sketch.top_k(10)
+    results["sketch_top_k_seconds"] = time.perf_counter() - t0
+    results["top10_matches_exact"] = [item for item, _ in sketch_top] == [item for item, _ in exact.top_k(10)]
+    results["deque_matches_bucketed"] = legacy.get_frequencies() == exact.frequencies
+    return results
+
+# Additional implementation at 2026-10-20 13:36:20
+import heapq
+import threading
+import time
+from collections import defaultdict
+from operator import itemgetter
+
+
+class LockedRollingFrequencyCounter:
+    """
+    Baseline for concurrent use: the deque-based RollingFrequencyCounter behind a
+    single global lock.
+    """
+
+    def __init__(self, window_duration_seconds):
+        self._counter = RollingFrequencyCounter(window_duration_seconds)
+        self._lock = threading.Lock()
+
+    def add_item(self, item, timestamp):
+        with self._lock:
+            self._counter.add_item(item, timestamp)
+
+    def get_count(self, item):
+        with self._lock:
+            return self._counter.get_count(item)
+
+    def most_common(self, n=None):
+        with self._lock:
+            return self._counter.most_common(n)
+
+    def total_items_in_window(self):
+        with self._lock:
+            return self._counter.total_items_in_window()
+
+
+class ConcurrentRollingFrequencyCounter:
+    """
+    Thread-safe rolling counter for concurrent producers using lock striping.
+
+    Items are hashed onto num_stripes independent BucketedRollingFrequencyCounter
+    instances, each with its own lock. Because every item lives in exactly one
+    stripe, merging the per-stripe top k gives the exact global top k.
+
+    Under the GIL striping does not make per-event add_item faster than one global
+    lock; the extra hashing and lock make it somewhat slower. The throughput gain
+    comes from add_items, which takes each stripe's lock once per batch and counts
+    the stripe's share in C (see benchmark_concurrent_counters).
+    """
+
+    def __init__(self, window_duration_seconds, num_buckets=60, num_stripes=16):
+        if num_stripes < 1:
+            raise ValueError("num_stripes must be at least 1.")
+        self.num_stripes = num_stripes
+        self._stripes = [BucketedRollingFrequencyCounter(window_duration_seconds, num_buckets)
+                         for _ in range(num_stripes)]
+        self._locks = [threading.Lock() for _ in range(num_stripes)]
+        self._latest = None
+        self._latest_lock = threading.Lock()
+
+    def _note_timestamp(self, timestamp):
+        # _latest only grows under _latest_lock, so the unlocked pre-check can skip
+        # the lock safely; the locked re-check keeps a slower producer from moving
+        # it backwards.
+        latest = self._latest
+        if latest is not None and timestamp <= latest:
+            return
+        with self._latest_lock:
+            if self._latest is None or timestamp > self._latest:
+                self._latest = timestamp
+
+    def add_item(self, item, timestamp):
+        stripe = hash(item) % self.num_stripes
+        with self._locks[stripe]:
+            self._stripes[stripe].add_item(item, timestamp)
+        self._note_timestamp(timestamp)
+
+    def add_items(self, items, timestamp):
+        """
+        Adds a batch sharing one timestamp, taking each stripe's lock once.
+        """
+        by_stripe = defaultdict(list)
+        num_stripes = self.num_stripes
+        for item in items:
+            by_stripe[hash(item) % num_stripes].append(item)
+        for stripe, stripe_items in by_stripe.items():
+            with self._locks[stripe]:
+                self._stripes[stripe].add_items(stripe_items, timestamp)
+        self._note_timestamp(timestamp)
+
+    def _advance_locked(self, stripe):
+        if self._latest is not None:
+            self._stripes[stripe].advance(self._latest)
+
+    def get_count(self, item):
+        stripe = hash(item) % self.num_stripes
+        with self._locks[stripe]:
+            self._advance_locked(stripe)
+            return self._stripes[stripe].get_count(item)
+
+    def top_k(self, k):
+        candidates = []
+        for stripe in range(self.num_stripes):
+            with self._locks[stripe]:
+                self._advance_locked(stripe)
+                candidates.extend(self._stripes[stripe].top_k(k))
+        return heapq.nlargest(k, candidates, key=itemgetter(1))
+
+    def most_common(self, n=None):
+        if n is not None:
+            return self.top_k(n)
+        items = []
+        for stripe in range(self.num_stripes):
+            with self._locks[stripe]:
+                self._advance_locked(stripe)
+                items.extend(self._stripes[stripe].frequencies.items())
+        items.sort(key=itemgetter(1), reverse=True)
+        return items
+
+    def total_items_in_window(self):
+        total = 0
+        for stripe in range(self.num_stripes):
+            with self._locks[stripe]:
+                self._advance_locked(stripe)
+                total += self._stripes[stripe].total_items_in_window()
+        return total
+
+    def clear(self):
+        for stripe in range(self.num_stripes):
+            with self._locks[stripe]:
+                self._stripes[stripe].clear()
+        with self._latest_lock:
+            self._latest = None
+
+
+def benchmark_concurrent_counters(thread_counts=(1, 2, 4, 8), events_per_thread=200_000,
+                                  num_items=10_000, batch_size=1_000):
+    """
+    Runs the same multi-producer workload against the globally locked deque counter,
+    the striped counter with per-event add_item, and the striped counter with
+    batched add_items. Returns {threads: {variant: events_per_second}} plus a
+    "batched_speedup" entry relative to the global lock; expect "striped" itself
+    to be no faster than "global_lock".
+    """
+    def run(counter_factory, num_threads, batched):
+        counter = counter_factory()
+        barrier = threading.Barrier(num_threads + 1)
+
+        def producer(offset):
+            items = [(offset * 7919 + i) % num_items for i in range(events_per_thread)]
+            barrier.wait()
+            if batched:
+                for start in range(0, events_per_thread, batch_size):
+                    counter.add_items(items[start:start + batch_size], start // batch_size)
+            else:
+                for i, item in enumerate(items):
+                    counter.add_item(item, i // batch_size)
+
+        threads = [threading.Thread(target=producer, args=(t,)) for t in range(num_threads)]
+        for thread in threads:
+            thread.start()
+        barrier.wait()
+        t0 = time.perf_counter()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - t0
+        expected = num_threads * events_per_thread
+        counted = counter.total_items_in_window()
+        if counted != expected:
+            raise RuntimeError(f"Counter lost events: counted {counted}, expected {expected}.")
+        return expected / elapsed
+
+    window = events_per_thread
+    results = {}
+    for num_threads in thread_counts:
+        results[num_threads] = {
+            "global_lock": run(lambda: LockedRollingFrequencyCounter(window), num_threads, False),
+            "striped": run(lambda: ConcurrentRollingFrequencyCounter(window), num_threads, False),
+            "striped_batched": run(lambda: ConcurrentRollingFrequencyCounter(window), num_threads, True),
+        }
+        results[num_threads]["batched_speedup"] = (
+            results[num_threads]["striped_batched"] / results[num_threads]["global_lock"])
+    return results
@@ -90,4 +90,288 @@ class Trie:
 
         suggestions = []
         self._find_words_from_node(node, prefix, suggestions)
-        return suggestions
\ No newline at end of file
+        return suggestions
+# Additional implementation at 2026-10-19 21:52:18
+import heapq
+from array import array
+from bisect import bisect_left
+
+
+class CompactTrie:
+    """
+    Static, array-backed trie built once from a word list.
+
+    Nodes are numbered in level order, so the children of a node are contiguous and
+    sorted by label. Every per-node field lives in a flat typed array instead of a
+    TrieNode object with its own dict:
+
+    - labels: code point of the edge leading into the node
+    - parents, first_child, child_count: tree structure
+    - weights: weight of the word ending at the node (NaN if none)
+    - subtree_counts: number of words in the node's subtree
+    - max_weights: largest word weight in the node's subtree
+    """
+
+    def __init__(self, labels, parents, first_child, child_count, weights, subtree_counts, max_weights):
+        self.labels = labels
+        self.parents = parents
+        self.first_child = first_child
+        self.child_count = child_count
+        self.weights = weights
+        self.subtree_counts = subtree_counts
+        self.max_weights = max_weights
+
+    @classmethod
+    def from_words(cls, words) -> "CompactTrie":
+        """
+        Builds the trie from an iterable of words or a {word: weight} mapping.
+        Repeated words in an iterable accumulate weight, so weights default to
+        word frequencies.
+        """
+        if isinstance(words, dict):
+            weighted = words
+        else:
+            weighted = {}
+            for word in words:
+                weighted[word] = weighted.get(word, 0) + 1
+        ordered = sorted(weighted)
+
+        labels = array('I', [0])
+        parents = array('I', [0])
+        first_child = array('I', [0])
+        child_count = array('I', [0])
+        weights = array('d', [float('nan')])
+
+        queue = [(0, 0, len(ordered), 0)]
+        head = 0
+        while head < len(queue):
+            node, lo, hi, depth = queue[head]
+            head += 1
+            if lo < hi and len(ordered[lo]) == depth:
+                weights[node] = weighted[ordered[lo]]
+                lo += 1
+            first_child[node] = len(labels)
+            while lo < hi:
+                char = ordered[lo][depth]
+                end = lo + 1
+                while end < hi and ordered[end][depth] == char:
+                    end += 1
+                child = len(labels)
+                labels.append(ord(char))
+                parents.append(node)
+                first_child.append(0)
+                child_count.append(0)
+                weights.append(float('nan'))
+                child_count[node] += 1
+                queue.append((child, lo, end, depth + 1))
+                lo = end
+        del queue
+
+        size = len(labels)
+        subtree_counts = array('I', bytes(4 * size))
+        max_weights = array('d', [float('-inf')]) * size
+        for node in range(size - 1, -1, -1):
+            weight = weights[node]
+            if weight == weight:
+                subtree_counts[node] += 1
+                if weight > max_weights[node]:
+                    max_weights[node] = weight
+            if node:
+                parent = parents[node]
+                subtree_counts[parent] += subtree_counts[node]
+                if max_weights[node] > max_weights[parent]:
+                    max_weights[parent] = max_weights[node]
+
+        return cls(labels, parents, first_child, child_count, weights, subtree_counts, max_weights)
+
+    def __len__(self) -> int:
+        return self.subtree_counts[0]
+
+    def freeze(self, path: str) -> None:
+        """
+        Writes the trie to a flat binary file for load_frozen_trie().
+        """
+        freeze_trie(self, path)
+
+    def _child(self, node: int, char: str) -> int:
+        start = self.first_child[node]
+        end = start + self.child_count[node]
+        code = ord(char)
+        index = bisect_left(self.labels, code, start, end)
+        if index < end and self.labels[index] == code:
+            return index
+        return -1
+
+    def _find_node(self, prefix: str) -> int:
+        node = 0
+        for char in prefix:
+            node = self._child(node, char)
+            if node < 0:
+                return -1
+        return node
+
+    def _word_at(self, node: int) -> str:
+        chars = []
+        while node:
+            chars.append(chr(self.labels[node]))
+            node = self.parents[node]
+        return "".join(reversed(chars))
+
+    def search(self, word: str) -> bool:
+        node = self._find_node(word)
+        return node >= 0 and self.weights[node] == self.weights[node]
+
+    def starts_with(self, prefix: str) -> bool:
+        return self._find_node(prefix) >= 0
+
+    def count_prefix(self, prefix: str) -> int:
+        """
+        Number of stored words starting with prefix, read from the subtree count.
+        """
+        node = self._find_node(prefix)
+        return self.subtree_counts[node] if node >= 0 else 0
+
+    def autocomplete(self, prefix: str, limit: int = None) -> list[str]:
+        """
+        Completions of prefix in lexicographic order, optionally stopping after limit.
+        """
+        node = self._find_node(prefix)
+        if node < 0:
+            return []
+        results = []
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            if self.weights[node] == self.weights[node]:
+                results.append(self._word_at(node))
+                if limit is not None and len(results) >= limit:
+                    break
+            start = self.first_child[node]
+            stack.extend(range(start + self.child_count[node] - 1, start - 1, -1))
+        return results
+
+    def top_k(self, prefix: str, k: int) -> list[tuple[str, float]]:
+        """
+        The k highest-weight completions of prefix as (word, weight), best first.
+
+        Uses a best-first search bounded by each subtree's max weight, so only the
+        branches that can still contribute to the answer are expanded.
+        """
+        node = self._find_node(prefix)
+        if node < 0 or k <= 0:
+            return []
+        results = []
+        heap = [(-self.max_weights[node], 1, node)]
+        while heap and len(results) < k:
+            negative_weight, is_subtree, node = heapq.heappop(heap)
+            if not is_subtree:
+                results.append((self._word_at(node), -negative_weight))
+                continue
+            weight = self.weights[node]
+            if weight == weight:
+                heapq.heappush(heap, (-weight, 0, node))
+            start = self.first_child[node]
+            for child in range(start, start + self.child_count[node]):
+                heapq.heappush(heap, (-self.max_weights[child], 1, child))
+        return results
+
+# Additional implementation at 2026-10-19 22:58:41
+import os
+import sys
+import mmap
+import struct
+from array import array
+
+FROZEN_TRIE_MAGIC = b'FTRI'
+FROZEN_TRIE_VERSION = 1
+_FROZEN_TRIE_HEADER = struct.Struct('<4sBBxxQ')
+_FROZEN_TRIE_FIELDS = (
+    ('labels', 'I'),
+    ('parents', 'I'),
+    ('first_child', 'I'),
+    ('child_count', 'I'),
+    ('weights', 'd'),
+    ('subtree_counts', 'I'),
+    ('max_weights', 'd'),
+)
+
+
+def _frozen_byteorder_flag() -> int:
+    return 0 if sys.byteorder == 'little' else 1
+
+
+def _align8(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+def freeze_trie(trie, path: str) -> None:
+    """
+    Serialises a Trie or CompactTrie to a flat binary file that load_frozen_trie()
+    can memory-map. The header is followed by each CompactTrie array in native byte
+    order, every array starting on an 8-byte boundary.
+    """
+    if not isinstance(trie, CompactTrie):
+        trie = CompactTrie.from_words(trie.autocomplete(""))
+    node_count = len(trie.labels)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(_FROZEN_TRIE_HEADER.pack(FROZEN_TRIE_MAGIC, FROZEN_TRIE_VERSION,
+                                         _frozen_byteorder_flag(), node_count))
+        for name, typecode in _FROZEN_TRIE_FIELDS:
+            values = getattr(trie, name)
+            if not isinstance(values, array) or values.typecode != typecode:
+                values = array(typecode, values)
+            f.write(b'\0' * (_align8(f.tell()) - f.tell()))
+            f.write(values.tobytes())
+    os.replace(tmp_path, path)
+
+
+class FrozenTrie(CompactTrie):
+    """
+    CompactTrie whose arrays are read-only views into a memory-mapped file written
+    by freeze(). Opening it does no parsing, and processes that map the same file
+    share its pages through the OS page cache.
+    """
+
+    def __init__(self, path: str):
+        with open(path, 'rb') as f:
+            header = f.read(_FROZEN_TRIE_HEADER.size)
+            if len(header) < _FROZEN_TRIE_HEADER.size:
+                raise ValueError(f"{path} is not a frozen trie file.")
+            magic, version, byteorder_flag, node_count = _FROZEN_TRIE_HEADER.unpack(header)
+            if magic != FROZEN_TRIE_MAGIC or version != FROZEN_TRIE_VERSION:
+                raise ValueError(f"{path} is not a frozen trie file.")
+            if byteorder_flag != _frozen_byteorder_flag():
+                raise ValueError(f"{path} was frozen on a machine with a different byte order.")
+
+            spans = {}
+            offset = _FROZEN_TRIE_HEADER.size
+            for name, typecode in _FROZEN_TRIE_FIELDS:
+                offset = _align8(offset)
+                size = node_count * array(typecode).itemsize
+                spans[name] = (offset, offset + size, typecode)
+                offset += size
+            if os.fstat(f.fileno()).st_size < offset:
+                raise ValueError(f"{path} is truncated: its header declares {node_count} nodes.")
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        with memoryview(self._mmap) as buffer:
+            views = {name: buffer[start:end].cast(typecode) for name, (start, end, typecode) in spans.items()}
+        super().__init__(**views)
+
+    def close(self) -> None:
+        for name, _ in _FROZEN_TRIE_FIELDS:
+            view = self.__dict__.pop(name, None)
+            if view is not None:
+                view.release()
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def load_frozen_trie(path: str) -> FrozenTrie:
+    return FrozenTrie(path)
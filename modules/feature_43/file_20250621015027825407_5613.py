@@ -113,4 +113,172 @@ class SlidingWindowMaximumCalculator:
             if i >= k - 1:
                 result.append(nums[dq[0]])
 
-        return result
\ No newline at end of file
+        return result
+# Additional implementation at 2026-10-20 14:49:12
+import time
+import collections
+import numpy as np
+
+_WINDOW_UFUNCS = {
+    'max': np.maximum,
+    'min': np.minimum,
+    'sum': np.add,
+    'mean': np.add,
+}
+
+
+def _resolve_window_ufunc(agg):
+    if isinstance(agg, np.ufunc):
+        return agg
+    if agg not in _WINDOW_UFUNCS:
+        raise ValueError(f"Unsupported aggregation '{agg}'. Choose from {sorted(_WINDOW_UFUNCS)} or pass a NumPy ufunc.")
+    return _WINDOW_UFUNCS[agg]
+
+
+def sliding_window_aggregate(values, k, agg='max'):
+    """
+    Aggregates every length-k window of a 1-D array with the van Herk/Gil-Werman
+    block algorithm: the input is cut into blocks of k, a prefix and a suffix scan
+    are taken within each block, and each window combines one suffix with one
+    prefix. This costs about three ufunc operations per element whatever k is.
+
+    agg is 'max', 'min', 'sum', 'mean' or any associative binary NumPy ufunc.
+    Returns an array of len(values) - k + 1 results.
+    """
+    arr = np.asarray(values)
+    if arr.ndim != 1:
+        raise ValueError("values must be one-dimensional.")
+    if arr.size and not (np.issubdtype(arr.dtype, np.number) or arr.dtype == np.bool_):
+        raise ValueError("All elements in 'values' must be numbers.")
+    if not isinstance(k, (int, np.integer)) or k <= 0:
+        raise ValueError("Window size 'k' must be a positive integer.")
+    n = arr.size
+    if k > n:
+        return np.empty(0, dtype=np.float64 if agg == 'mean' else arr.dtype)
+
+    ufunc = _resolve_window_ufunc(agg)
+    blocks = -(-n // k)
+    padded = np.pad(arr, (0, blocks * k - n), mode='edge').reshape(blocks, k)
+    prefix = ufunc.accumulate(padded, axis=1).ravel()
+    suffix = ufunc.accumulate(padded[:, ::-1], axis=1)[:, ::-1].ravel()
+
+    starts = np.arange(n - k + 1)
+    result = ufunc(suffix[:n - k + 1], prefix[k - 1:n])
+    aligned = starts % k == 0
+    result[aligned] = prefix[starts[aligned] + k - 1]
+    if agg == 'mean':
+        result = result / k
+    return result
+
+
+class StreamingWindowAggregator:
+    """
+    Sliding-window aggregate over an unbounded feed, one value or one chunk at a time.
+
+    Uses the two-stack form of van Herk/Gil-Werman: new values go on a back stack
+    with a running aggregate, and when the front stack runs out the back stack is
+    flipped into suffix aggregates. Each push is amortised O(1) and no aggregate is
+    ever "subtracted", so sums do not drift.
+    """
+
+    def __init__(self, k, agg='max'):
+        if not isinstance(k, (int, np.integer)) or k <= 0:
+            raise ValueError("Window size 'k' must be a positive integer.")
+        k = int(k)
+        self.k = k
+        self.agg = agg
+        self._ufunc = _resolve_window_ufunc(agg)
+        self._op = {'max': max, 'min': min, 'sum': lambda a, b: a + b,
+                    'mean': lambda a, b: a + b}.get(agg, self._ufunc)
+        self._front = []
+        self._back = []
+        self._back_agg = None
+        self._tail = collections.deque(maxlen=k - 1) if k > 1 else None
+
+    def __len__(self):
+        return len(self._front) + len(self._back)
+
+    def _append(self, value):
+        op = self._op
+        self._back.append(value)
+        self._back_agg = value if self._back_agg is None else op(self._back_agg, value)
+        if self._tail is not None:
+            self._tail.append(value)
+        if len(self) > self.k:
+            if not self._front:
+                running = None
+                for item in reversed(self._back):
+                    running = item if running is None else op(item, running)
+                    self._front.append(running)
+                self._back.clear()
+                self._back_agg = None
+            self._front.pop()
+
+    def push(self, value):
+        """
+        Adds one value. Returns the aggregate of the last k values, or None until
+        k values have been seen.
+        """
+        self._append(value)
+        if len(self) < self.k:
+            return None
+        if not self._front:
+            result = self._back_agg
+        elif self._back_agg is None:
+            result = self._front[-1]
+        else:
+            result = self._op(self._front[-1], self._back_agg)
+        return result / self.k if self.agg == 'mean' else result
+
+    def push_many(self, values):
+        """
+        Adds a chunk of values and returns a NumPy array with one aggregate for every
+        window that ends inside the chunk, computed with sliding_window_aggregate.
+        push() and push_many() can be mixed freely.
+        """
+        chunk = np.asarray(values)
+        if self._tail:
+            history = np.asarray(self._tail)
+            window = np.concatenate((history, chunk), dtype=np.result_type(history, chunk))
+        else:
+            window = chunk
+        result = sliding_window_aggregate(window, self.k, self.agg)
+        for value in chunk[-self.k:].tolist():
+            self._append(value)
+        return result
+
+
+class VectorizedSlidingWindowCalculator:
+    """
+    NumPy counterpart of SlidingWindowMaximumCalculator for large arrays.
+    """
+
+    def calculate_maximums(self, nums, k):
+        return sliding_window_aggregate(nums, k, 'max')
+
+    def calculate_minimums(self, nums, k):
+        return sliding_window_aggregate(nums, k, 'min')
+
+    def calculate_sums(self, nums, k):
+        return sliding_window_aggregate(nums, k, 'sum')
+
+    def calculate_means(self, nums, k):
+        return sliding_window_aggregate(nums, k, 'mean')
+
+
+def benchmark_sliding_window(n=1_000_000, k=1_000, seed=0):
+    rng = np.random.default_rng(seed)
+    arr = rng.random(n)
+    values = arr.tolist()
+    t0 = time.perf_counter()
+    expected = sliding_window_maximum(values, k)
+    deque_seconds = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    result = sliding_window_aggregate(arr, k, 'max')
+    vectorized_seconds = time.perf_counter() - t0
+    return {
+        "deque_seconds": deque_seconds,
+        "vectorized_seconds": vectorized_seconds,
+        "speedup": deque_seconds / vectorized_seconds,
+        "matches": np.array_equal(result, np.asarray(expected)),
+    }
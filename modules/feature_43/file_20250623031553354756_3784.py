@@ -438,4 +438,365 @@ def main():
             break
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
+
+# Additional implementation at 2026-10-20 16:02:45
+import csv
+import math
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+
+
+class RunningCovariance:
+    """
+    Single-pass, mergeable accumulator for the mean, variance, covariance and
+    Pearson correlation of paired data.
+
+    Values are folded in with Welford's update (one pair at a time) or Chan et al.'s
+    pairwise combination (a whole chunk at a time), so deviations are never summed
+    from scratch and no intermediate lists are built. Accumulators built over
+    separate chunks, files or processes can be combined with merge().
+    """
+
+    __slots__ = ("count", "mean_x", "mean_y", "m2_x", "m2_y", "c_xy")
+
+    def __init__(self):
+        self.count = 0
+        self.mean_x = 0.0
+        self.mean_y = 0.0
+        self.m2_x = 0.0
+        self.m2_y = 0.0
+        self.c_xy = 0.0
+
+    def update(self, x, y):
+        """
+        Adds one (x, y) pair. Pairs where either value is missing (None or NaN) are
+        skipped, as in update_batch.
+        """
+        if x is None or y is None:
+            return
+        x = float(x)
+        y = float(y)
+        if math.isnan(x) or math.isnan(y):
+            return
+        self.count += 1
+        n = self.count
+        dx = x - self.mean_x
+        self.mean_x += dx / n
+        dy = y - self.mean_y
+        self.mean_y += dy / n
+        self.m2_x += dx * (x - self.mean_x)
+        self.m2_y += dy * (y - self.mean_y)
+        self.c_xy += dx * (y - self.mean_y)
+
+    def update_batch(self, xs, ys):
+        """
+        Adds a chunk of pairs. Pairs where either value is NaN are skipped, matching
+        pearson_correlation's handling of missing values.
+        """
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+        if xs.shape != ys.shape:
+            raise ValueError("Input chunks must have the same length.")
+        valid = ~(np.isnan(xs) | np.isnan(ys))
+        if not valid.all():
+            xs = xs[valid]
+            ys = ys[valid]
+        if xs.size == 0:
+            return self
+        chunk = RunningCovariance()
+        chunk.count = int(xs.size)
+        chunk.mean_x = float(xs.mean())
+        chunk.mean_y = float(ys.mean())
+        dx = xs - chunk.mean_x
+        dy = ys - chunk.mean_y
+        chunk.m2_x = float(dx @ dx)
+        chunk.m2_y = float(dy @ dy)
+        chunk.c_xy = float(dx @ dy)
+        return self.merge(chunk)
+
+    def merge(self, other):
+        """Folds another accumulator into this one in place and returns self."""
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            for name in self.__slots__:
+                setattr(self, name, getattr(other, name))
+            return self
+        n = self.count + other.count
+        dx = other.mean_x - self.mean_x
+        dy = other.mean_y - self.mean_y
+        weight = self.count * other.count / n
+        self.m2_x += other.m2_x + dx * dx * weight
+        self.m2_y += other.m2_y + dy * dy * weight
+        self.c_xy += other.c_xy + dx * dy * weight
+        self.mean_x += dx * other.count / n
+        self.mean_y += dy * other.count / n
+        self.count = n
+        return self
+
+    def variance_x(self):
+        """Sample variance of x (NaN with fewer than two pairs)."""
+        return self.m2_x / (self.count - 1) if self.count > 1 else float('nan')
+
+    def variance_y(self):
+        return self.m2_y / (self.count - 1) if self.count > 1 else float('nan')
+
+    def std_x(self):
+        return math.sqrt(self.variance_x())
+
+    def std_y(self):
+        return math.sqrt(self.variance_y())
+
+    def covariance(self):
+        """Sample covariance of x and y (NaN with fewer than two pairs)."""
+        return self.c_xy / (self.count - 1) if self.count > 1 else float('nan')
+
+    def pearson(self):
+        """
+        Pearson r, or NaN when there are fewer than two pairs or either variable has
+        no variance.
+        """
+        if self.count < 2 or self.m2_x == 0 or self.m2_y == 0:
+            return float('nan')
+        r = self.c_xy / math.sqrt(self.m2_x * self.m2_y)
+        if math.isnan(r):
+            return r
+        return max(-1.0, min(1.0, r))
+
+
+def _parse_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float('nan')
+
+
+def streaming_correlation_from_csv(filepath, column_x, column_y, chunk_rows=100_000):
+    """
+    Accumulates a RunningCovariance over two columns of a CSV file, reading
+    chunk_rows rows at a time so memory stays bounded whatever the file size.
+    Rows with a missing or non-numeric value in either column are skipped.
+    """
+    accumulator = RunningCovariance()
+    with open(filepath, 'r', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return accumulator
+        try:
+            ix, iy = header.index(column_x), header.index(column_y)
+        except ValueError:
+            raise ValueError(f"Columns '{column_x}' and '{column_y}' must both be in the CSV header.")
+        xs, ys = [], []
+        for row in reader:
+            if len(row) <= max(ix, iy):
+                continue
+            xs.append(_parse_float(row[ix]))
+            ys.append(_parse_float(row[iy]))
+            if len(xs) >= chunk_rows:
+                accumulator.update_batch(xs, ys)
+                xs, ys = [], []
+        if xs:
+            accumulator.update_batch(xs, ys)
+    return accumulator
+
+
+def _correlation_file_task(task):
+    return streaming_correlation_from_csv(*task)
+
+
+def streaming_correlation_from_files(filepaths, column_x, column_y, chunk_rows=100_000, workers=None):
+    """
+    Processes each CSV file in its own worker process and merges the per-file
+    accumulators into a single RunningCovariance.
+    """
+    tasks = [(path, column_x, column_y, chunk_rows) for path in filepaths]
+    total = RunningCovariance()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for partial in executor.map(_correlation_file_task, tasks):
+            total.merge(partial)
+    return total
+
+# Additional implementation at 2026-10-20 16:41:12
+import time
+import numpy as np
+import pandas as pd
+
+# Rows per chunk are chosen so one float64 chunk stays around 64 MB.
+CORRELATION_CHUNK_BYTES = 64 * 1024 * 1024
+
+
+def _default_chunk_rows(n_columns):
+    return max(1, CORRELATION_CHUNK_BYTES // (8 * max(1, n_columns)))
+
+
+class CorrelationMatrixAccumulator:
+    """
+    Builds a Pearson correlation matrix from row chunks without holding the data.
+
+    For every pair of columns it keeps the sufficient statistics needed for pairwise
+    deletion (the same NaN handling as DataFrame.corr): the number of rows where both
+    values are present, the sums and sums of squares of each column over those rows,
+    and the cross-products. Each statistic is a matrix product over the chunk, so the
+    work is done by BLAS. Chunks without missing values skip the mask products.
+
+    Values are shifted by a per-column reference (the column mean of the first chunk
+    in which the column has data) before accumulation, which keeps the raw-sum
+    formulas accurate for columns with a large offset.
+    """
+
+    def __init__(self, columns=None):
+        self.columns = list(columns) if columns is not None else None
+        self.shift = None
+        self._shift_pending = None
+        self.rows = 0
+        self.counts = None
+        self.sums = None
+        self.sums_sq = None
+        self.cross = None
+
+    def _initialise(self, chunk):
+        n_columns = chunk.shape[1]
+        if self.columns is None:
+            self.columns = list(range(n_columns))
+        elif len(self.columns) != n_columns:
+            raise ValueError(f"Expected {len(self.columns)} columns, got {n_columns}.")
+        self.shift = np.zeros(n_columns)
+        self._shift_pending = np.ones(n_columns, dtype=bool)
+        self.counts = np.zeros((n_columns, n_columns))
+        self.sums = np.zeros((n_columns, n_columns))
+        self.sums_sq = np.zeros((n_columns, n_columns))
+        self.cross = np.zeros((n_columns, n_columns))
+
+    def update(self, chunk):
+        """
+        Adds a 2D chunk of rows (NumPy array or DataFrame). NaN marks a missing value.
+        """
+        if isinstance(chunk, pd.DataFrame):
+            chunk = chunk.to_numpy(dtype=np.float64, na_value=np.nan)
+        chunk = np.asarray(chunk, dtype=np.float64)
+        if chunk.ndim != 2:
+            raise ValueError("Chunks must be two-dimensional (rows x columns).")
+        if self.shift is None:
+            self._initialise(chunk)
+        elif chunk.shape[1] != self.cross.shape[0]:
+            raise ValueError(f"Expected {self.cross.shape[0]} columns, got {chunk.shape[1]}.")
+        if chunk.shape[0] == 0:
+            return self
+
+        if self._shift_pending.any():
+            # Columns without data so far have all-zero statistics, so their shift can
+            # still be chosen freely.
+            pending = np.flatnonzero(self._shift_pending)
+            block = chunk[:, pending]
+            seen = ~np.isnan(block).all(axis=0)
+            if seen.any():
+                self.shift[pending[seen]] = np.nanmean(block[:, seen], axis=0)
+                self._shift_pending[pending[seen]] = False
+
+        values = chunk - self.shift
+        missing = np.isnan(values)
+        if missing.any():
+            present = (~missing).astype(np.float64)
+            values[missing] = 0.0
+            # sums[i, j] is the sum of column i over rows where column j is present.
+            self.counts += present.T @ present
+            self.sums += values.T @ present
+            self.sums_sq += (values * values).T @ present
+        else:
+            self.counts += values.shape[0]
+            self.sums += values.sum(axis=0)[:, None]
+            self.sums_sq += np.einsum('ij,ij->j', values, values)[:, None]
+        self.cross += values.T @ values
+        self.rows += chunk.shape[0]
+        return self
+
+    def correlation_matrix(self, min_periods=2):
+        """
+        Returns the Pearson correlation matrix as an ndarray. Pairs with fewer than
+        min_periods shared rows, or with no variance over those rows, are NaN.
+        """
+        if self.cross is None:
+            return np.empty((0, 0))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            n = self.counts
+            cov = self.cross - self.sums * self.sums.T / n
+            var_i = self.sums_sq - self.sums * self.sums / n
+            var_j = var_i.T
+            corr = cov / np.sqrt(var_i * var_j)
+        corr[(n < max(min_periods, 2)) | ~(var_i > 0) | ~(var_j > 0)] = np.nan
+        return np.clip(corr, -1.0, 1.0)
+
+    def to_frame(self, min_periods=2):
+        """Returns the correlation matrix as a labelled DataFrame."""
+        return pd.DataFrame(self.correlation_matrix(min_periods), index=self.columns, columns=self.columns)
+
+
+def fast_correlation_matrix(data, chunk_rows=None):
+    """
+    Pearson correlation matrix of a 2D array or DataFrame, with pairwise deletion of
+    NaNs. Non-numeric DataFrame columns are excluded, as in calculate_correlation_matrix.
+    """
+    if isinstance(data, pd.DataFrame):
+        data = data.select_dtypes(include='number')
+        accumulator = CorrelationMatrixAccumulator(data.columns)
+    else:
+        data = np.asarray(data, dtype=np.float64)
+        accumulator = CorrelationMatrixAccumulator()
+    chunk_rows = chunk_rows or _default_chunk_rows(data.shape[1])
+    for start in range(0, max(len(data), 1), chunk_rows):
+        chunk = data.iloc[start:start + chunk_rows] if isinstance(data, pd.DataFrame) else data[start:start + chunk_rows]
+        accumulator.update(chunk)
+    return accumulator.to_frame() if isinstance(data, pd.DataFrame) else accumulator.correlation_matrix()
+
+
+def correlation_matrix_from_csv(filepath, columns=None, chunk_rows=None, **read_csv_kwargs):
+    """
+    Streams a CSV file through a CorrelationMatrixAccumulator and returns the
+    correlation DataFrame. Only the numeric columns of the first chunk are used
+    unless columns is given; later chunks are coerced, so stray text becomes NaN.
+    """
+    header = pd.read_csv(filepath, nrows=0, **read_csv_kwargs).columns
+    usecols = list(columns) if columns is not None else list(header)
+    chunk_rows = chunk_rows or _default_chunk_rows(len(usecols))
+    accumulator = None
+    for chunk in pd.read_csv(filepath, usecols=usecols, chunksize=chunk_rows, **read_csv_kwargs):
+        if accumulator is None:
+            if columns is None:
+                usecols = list(chunk.select_dtypes(include='number').columns)
+            accumulator = CorrelationMatrixAccumulator(usecols)
+        block = chunk[usecols].apply(pd.to_numeric, errors='coerce')
+        accumulator.update(block)
+    if accumulator is None:
+        return pd.DataFrame(index=usecols, columns=usecols, dtype=float)
+    return accumulator.to_frame()
+
+
+def benchmark_correlation_matrix(n_rows=200_000, n_columns=200, nan_fraction=0.01, seed=0):
+    """
+    Compares fast_correlation_matrix with calculate_correlation_matrix (pandas .corr)
+    on random data with missing values and reports timings and the largest difference.
+    """
+    rng = np.random.default_rng(seed)
+    data = rng.normal(size=(n_rows, n_columns))
+    data[:, 1:] += 0.3 * data[:, :1]
+    data[rng.random(data.shape) < nan_fraction] = np.nan
+    df = pd.DataFrame(data, columns=[f"c{i}" for i in range(n_columns)])
+
+    start = time.perf_counter()
+    expected = calculate_correlation_matrix(df)
+    pandas_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = fast_correlation_matrix(df)
+    fast_seconds = time.perf_counter() - start
+
+    return {
+        'rows': n_rows,
+        'columns': n_columns,
+        'pandas_seconds': pandas_seconds,
+        'fast_seconds': fast_seconds,
+        'speedup': pandas_seconds / fast_seconds if fast_seconds else float('inf'),
+        'max_abs_difference': float(np.nanmax(np.abs(result.to_numpy() - expected.to_numpy()))),
+    }
@@ -284,4 +284,462 @@ class OutlierDetector:
         non_outlier_mask = np.ones(len(self.data), dtype=bool)
         non_outlier_mask[outlier_indices] = False
 
-        return self.data[non_outlier_mask]
\ No newline at end of file
+        return self.data[non_outlier_mask]
+
+# Additional implementation at 2026-10-20 17:24:36
+import math
+import numpy as np
+
+
+class TDigest:
+    """
+    Merging t-digest for approximate quantiles of an unbounded stream.
+
+    Incoming values are buffered and periodically merged into a sorted list of
+    weighted centroids. Centroid sizes are limited by the arcsine scale function, so
+    centroids stay small near the tails and the digest never holds more than about
+    compression / 2 centroids plus the buffer.
+    """
+
+    def __init__(self, compression=200, buffer_size=None):
+        if compression < 10:
+            raise ValueError("compression must be at least 10.")
+        self.compression = compression
+        self.buffer_size = buffer_size or max(1000, 10 * compression)
+        self.means = np.empty(0)
+        self.weights = np.empty(0)
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+        self._pending = []
+        self._pending_count = 0
+
+    def add(self, value):
+        """Adds one value; NaN is ignored, as in add_many."""
+        if math.isnan(value):
+            return
+        self._pending.append(np.array([value], dtype=float))
+        self._pending_count += 1
+        if self._pending_count >= self.buffer_size:
+            self._compress()
+
+    def add_many(self, values):
+        """Adds a chunk of values; NaNs are ignored."""
+        values = np.asarray(values, dtype=float).ravel()
+        values = values[~np.isnan(values)]
+        if values.size == 0:
+            return
+        self._pending.append(values)
+        self._pending_count += values.size
+        if self._pending_count >= self.buffer_size:
+            self._compress()
+
+    def merge(self, other):
+        """Folds another digest into this one, e.g. one built on another worker."""
+        other._compress()
+        if other.count:
+            self._compress()
+            self._merge_centroids(other.means, other.weights)
+            self.min = min(self.min, other.min)
+            self.max = max(self.max, other.max)
+        return self
+
+    def _compress(self):
+        if not self._pending:
+            return
+        values = np.concatenate(self._pending)
+        self._pending = []
+        self._pending_count = 0
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+        self._merge_centroids(values, np.ones(values.size))
+
+    def _merge_centroids(self, means, weights):
+        means = np.concatenate((self.means, means))
+        weights = np.concatenate((self.weights, weights))
+        order = np.argsort(means, kind='stable')
+        means = means[order]
+        weights = weights[order]
+        total = weights.sum()
+        # Each item is assigned to the unit interval of the scale function that its
+        # centre of mass falls into; items sharing an interval become one centroid.
+        q = (np.cumsum(weights) - weights / 2) / total
+        k = self.compression / (2 * math.pi) * np.arcsin(np.clip(2 * q - 1, -1.0, 1.0))
+        cluster = np.floor(k - k[0]).astype(np.int64)
+        starts = np.flatnonzero(np.r_[True, cluster[1:] != cluster[:-1]])
+        merged_weights = np.add.reduceat(weights, starts)
+        self.means = np.add.reduceat(means * weights, starts) / merged_weights
+        self.weights = merged_weights
+        self.count = int(round(total))
+
+    def quantile(self, q):
+        """
+        Approximate q-quantile (0 <= q <= 1), using the same linear interpolation
+        between ranks as calculate_percentile. Returns None for an empty digest.
+        """
+        self._compress()
+        if self.count == 0:
+            return None
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1.")
+        ends = np.cumsum(self.weights)
+        mid_ranks = ends - (self.weights + 1) / 2
+        ranks = np.concatenate(([0.0], mid_ranks, [self.count - 1]))
+        values = np.concatenate(([self.min], self.means, [self.max]))
+        return float(np.interp(q * (self.count - 1), ranks, values))
+
+    def centroid_count(self):
+        self._compress()
+        return len(self.means)
+
+
+class StreamingOutlierDetector:
+    """
+    Flags outliers in a stream as values arrive, in bounded memory.
+
+    Each value (or chunk) is judged against the bounds implied by everything seen
+    before it, then folded into the state: a TDigest for the IQR method and running
+    Welford moments for the Z-score method. Nothing is flagged until warmup values
+    have been seen.
+    """
+
+    def __init__(self, method='iqr', k=1.5, threshold=3.0, compression=200, warmup=100):
+        if method not in ('iqr', 'zscore'):
+            raise ValueError("Invalid method. Choose 'zscore' or 'iqr'.")
+        self.method = method
+        self.k = k
+        self.threshold = threshold
+        self.warmup = max(2, warmup)
+        self.digest = TDigest(compression)
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self._cached_bounds = None
+        self._cached_digest_count = -1
+
+    @property
+    def std_dev(self):
+        """Population standard deviation, matching np.std in OutlierDetector."""
+        return math.sqrt(self._m2 / self.count) if self.count else 0.0
+
+    def bounds(self):
+        """
+        Current (lower, upper) bounds, or None while warming up or when the spread is
+        zero (the same cases OutlierDetector reports no outliers for).
+        """
+        if self.count < self.warmup:
+            return None
+        if self.method == 'iqr':
+            q1 = self.digest.quantile(0.25)
+            q3 = self.digest.quantile(0.75)
+            iqr = q3 - q1
+            if iqr == 0:
+                return None
+            return q1 - self.k * iqr, q3 + self.k * iqr
+        std_dev = self.std_dev
+        if std_dev == 0:
+            return None
+        return self.mean - self.threshold * std_dev, self.mean + self.threshold * std_dev
+
+    def _update_bounds(self):
+        # IQR bounds for update() are only recomputed after the digest has flushed
+        # its buffer, so buffer_size values share one quantile computation instead
+        # of compressing the digest for every value.
+        if self.method != 'iqr' or self.count < self.warmup:
+            return self.bounds()
+        if self.digest.count != self._cached_digest_count:
+            self._cached_bounds = self.bounds()
+            self._cached_digest_count = self.digest.count
+        return self._cached_bounds
+
+    def update(self, value):
+        """
+        Judges one value against the current bounds, adds it, and returns True if it
+        is an outlier. NaN is ignored, as in update_many(). IQR bounds lag by at most
+        the digest's buffer_size values.
+        """
+        if math.isnan(value):
+            return False
+        bounds = self._update_bounds()
+        is_outlier = bounds is not None and (value < bounds[0] or value > bounds[1])
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        self.digest.add(value)
+        return is_outlier
+
+    def update_many(self, values):
+        """
+        Judges a chunk against the bounds from before the chunk, adds it, and returns
+        a boolean outlier mask. Values seen during warmup are never flagged.
+        """
+        values = np.asarray(values, dtype=float).ravel()
+        values = values[~np.isnan(values)]
+        mask = np.zeros(values.size, dtype=bool)
+        if values.size == 0:
+            return mask
+        skip = 0
+        if self.count < self.warmup:
+            skip = min(values.size, self.warmup - self.count)
+            self._add_chunk(values[:skip])
+        if skip < values.size:
+            rest = values[skip:]
+            bounds = self.bounds()
+            if bounds is not None:
+                mask[skip:] = (rest < bounds[0]) | (rest > bounds[1])
+            self._add_chunk(rest)
+        return mask
+
+    def _add_chunk(self, values):
+        n = values.size
+        chunk_mean = float(values.mean())
+        chunk_m2 = float(((values - chunk_mean) ** 2).sum())
+        total = self.count + n
+        delta = chunk_mean - self.mean
+        self._m2 += chunk_m2 + delta * delta * self.count * n / total
+        self.mean += delta * n / total
+        self.count = total
+        self.digest.add_many(values)
+
+    def process(self, stream, chunk_size=10_000):
+        """
+        Consumes an iterable of numbers and yields (index, value) for every outlier,
+        judging chunk_size values at a time. Works on unbounded iterators.
+        """
+        index = 0
+        chunk = []
+        for value in stream:
+            chunk.append(value)
+            if len(chunk) >= chunk_size:
+                yield from self._flush(chunk, index)
+                index += len(chunk)
+                chunk = []
+        if chunk:
+            yield from self._flush(chunk, index)
+
+    def _flush(self, chunk, offset):
+        values = np.asarray(chunk, dtype=float)
+        valid = np.flatnonzero(~np.isnan(values))
+        mask = self.update_many(values)
+        for position in valid[mask]:
+            yield offset + int(position), float(values[position])
+
+
+_BasicOutlierDetector = OutlierDetector
+
+
+class OutlierDetector(_BasicOutlierDetector):
+    """
+    OutlierDetector with a streaming mode that works from a quantile sketch and
+    running moments instead of the full sorted dataset.
+    """
+
+    def find_outliers_streaming(self, method='iqr', threshold=3.0, compression=200, two_pass=True, chunk_size=10_000):
+        """
+        Detects outliers with a TDigest (IQR) or running moments (Z-score).
+
+        With two_pass=True the sketch is built over all data first and every value is
+        judged against the final bounds, approximating find_outliers_iqr and
+        find_outliers_zscore. With two_pass=False values are flagged on the fly, as
+        StreamingOutlierDetector does for unbounded streams.
+
+        Returns:
+            tuple: A tuple containing:
+                   - list: Outlier values.
+                   - list: Indices of outlier values in the original data.
+        """
+        if not self._check_data_sufficiency(min_len=2):
+            return [], []
+        detector = StreamingOutlierDetector(method=method, threshold=threshold, compression=compression,
+                                            warmup=len(self.data) if two_pass else 100)
+        if two_pass:
+            for start in range(0, len(self.data), chunk_size):
+                detector.update_many(self.data[start:start + chunk_size])
+            bounds = detector.bounds()
+            if bounds is None:
+                return [], []
+            outlier_indices = np.where((self.data < bounds[0]) | (self.data > bounds[1]))[0]
+        else:
+            outlier_indices = np.array([i for i, _ in detector.process(self.data, chunk_size)], dtype=int)
+        return self.data[outlier_indices].tolist(), outlier_indices.tolist()
+
+
+def compare_streaming_outliers(data, method='iqr', threshold=3.0, compression=200, chunk_size=10_000):
+    """
+    Reports how closely the streaming modes reproduce the exact outlier sets.
+
+    Returns:
+        dict: Exact and sketched quartiles, outlier counts, and precision/recall of
+              the two-pass and on-the-fly streaming results against the exact method.
+    """
+    detector = OutlierDetector(list(data))
+    if method == 'iqr':
+        exact_values, exact_indices = detector.find_outliers_iqr()
+    else:
+        exact_values, exact_indices = detector.find_outliers_zscore(threshold)
+    exact = set(exact_indices)
+
+    def score(indices):
+        found = set(indices)
+        hits = len(found & exact)
+        return {
+            'outliers': len(found),
+            'precision': hits / len(found) if found else 1.0,
+            'recall': hits / len(exact) if exact else 1.0,
+        }
+
+    _, two_pass = detector.find_outliers_streaming(method, threshold, compression, True, chunk_size)
+    _, online = detector.find_outliers_streaming(method, threshold, compression, False, chunk_size)
+    digest = TDigest(compression)
+    digest.add_many(detector.data)
+    return {
+        'count': len(detector.data),
+        'exact_q1': float(np.percentile(detector.data, 25)),
+        'sketch_q1': digest.quantile(0.25),
+        'exact_q3': float(np.percentile(detector.data, 75)),
+        'sketch_q3': digest.quantile(0.75),
+        'centroids': digest.centroid_count(),
+        'exact_outliers': len(exact),
+        'two_pass': score(two_pass),
+        'online': score(online),
+    }
+
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(42)
+    stream_data = np.concatenate([rng.normal(50, 10, 1_000_000), rng.uniform(-100, 200, 1000)])
+    rng.shuffle(stream_data)
+    print(compare_streaming_outliers(stream_data, method='iqr'))
+    print(compare_streaming_outliers(stream_data, method='zscore'))
+
+
+# Additional implementation at 2026-10-20 18:05:51
+import time
+import numpy as np
+
+
+def _percentile_positions(n, percentiles):
+    """Lower rank and interpolation fraction for each percentile, as in calculate_percentile."""
+    positions = []
+    for percentile in percentiles:
+        k = (n - 1) * (percentile / 100.0)
+        f = int(k)
+        positions.append((f, k - f))
+    return positions
+
+
+def select_percentiles(data, percentiles):
+    """
+    Exact percentiles without sorting the data.
+
+    All ranks needed by the requested percentiles (and their interpolation
+    neighbours) are placed with a single np.partition (introselect) call, which is
+    O(n) instead of O(n log n). Results match calculate_percentile on sorted data.
+
+    Args:
+        data (list or numpy.ndarray): The numerical data, in any order.
+        percentiles (iterable of float): Percentiles between 0 and 100.
+
+    Returns:
+        list: One value per requested percentile, or None for each if data is empty.
+    """
+    percentiles = list(percentiles)
+    values = np.asarray(data, dtype=float).ravel()
+    n = values.size
+    if n == 0:
+        return [None] * len(percentiles)
+    positions = _percentile_positions(n, percentiles)
+    kth = sorted({f for f, _ in positions} | {f + 1 for f, _ in positions if f + 1 < n})
+    partitioned = np.partition(values, kth)
+    results = []
+    for f, c in positions:
+        if f + 1 < n:
+            results.append(float(partitioned[f] + (partitioned[f + 1] - partitioned[f]) * c))
+        else:
+            results.append(float(partitioned[f]))
+    return results
+
+
+def select_percentiles_batch(series, percentiles):
+    """
+    select_percentiles for many series. Equal-length series are stacked and
+    partitioned row-wise in one call; ragged input is handled series by series.
+
+    Returns:
+        list: A list of percentile lists, one per series.
+    """
+    percentiles = list(percentiles)
+    series = list(series)
+    if not series:
+        return []
+    lengths = {len(s) for s in series}
+    if len(lengths) != 1 or 0 in lengths:
+        return [select_percentiles(s, percentiles) for s in series]
+    matrix = np.asarray(series, dtype=float)
+    n = matrix.shape[1]
+    positions = _percentile_positions(n, percentiles)
+    kth = sorted({f for f, _ in positions} | {f + 1 for f, _ in positions if f + 1 < n})
+    partitioned = np.partition(matrix, kth, axis=1)
+    columns = []
+    for f, c in positions:
+        if f + 1 < n:
+            columns.append(partitioned[:, f] + (partitioned[:, f + 1] - partitioned[:, f]) * c)
+        else:
+            columns.append(partitioned[:, f])
+    return np.column_stack(columns).tolist()
+
+
+def find_outliers(data):
+    if not data or len(data) < 2:
+        return []
+
+    q1, q3 = select_percentiles(data, (25, 75))
+
+    iqr = q3 - q1
+
+    lower_bound = q1 - 1.5 * iqr
+    upper_bound = q3 + 1.5 * iqr
+
+    values = np.asarray(data, dtype=float)
+    outlier_indices = np.flatnonzero((values < lower_bound) | (values > upper_bound))
+
+    return [data[i] for i in outlier_indices]
+
+
+def benchmark_percentiles(n=50_000_000, seed=0):
+    """
+    Times Q1/Q3 via sorted() + calculate_percentile against select_percentiles on the
+    same list and on a prebuilt ndarray.
+    """
+    rng = np.random.default_rng(seed)
+    array = rng.normal(size=n)
+    values = array.tolist()
+
+    start = time.perf_counter()
+    sorted_values = sorted(values)
+    expected = [calculate_percentile(sorted_values, 25), calculate_percentile(sorted_values, 75)]
+    sorted_seconds = time.perf_counter() - start
+    del sorted_values
+
+    start = time.perf_counter()
+    from_list = select_percentiles(values, (25, 75))
+    list_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    from_array = select_percentiles(array, (25, 75))
+    array_seconds = time.perf_counter() - start
+
+    return {
+        'n': n,
+        'sorted_seconds': sorted_seconds,
+        'select_list_seconds': list_seconds,
+        'select_array_seconds': array_seconds,
+        'matches': expected == from_list == from_array,
+    }
+
+
+if __name__ == "__main__":
+    print(f"Outliers: {find_outliers([10, 12, 12, 13, 12, 11, 14, 13, 15, 10, 6, 13, 12, 100, 1, 200])}")
+    print(select_percentiles_batch([[1, 2, 3, 4], [4, 3, 2, 100]], (25, 50, 75)))
+    print(benchmark_percentiles(n=200_000))
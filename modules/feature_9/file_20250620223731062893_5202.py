@@ -436,4 +436,489 @@ if __name__ == "__main__":
     encoded_empty, tree_empty, padding_empty = coder.compress(empty_text)
     decoded_empty = coder.decompress(encoded_empty, tree_empty, padding_empty)
     print(f"Original: '{empty_text}', Decoded: '{decoded_empty}'")
-    print("Decoded empty text matches original:", empty_text == decoded_empty)
\ No newline at end of file
+    print("Decoded empty text matches original:", empty_text == decoded_empty)
+# Additional implementation at 2026-10-19 16:31:07
+import sys
+import heapq
+import struct
+import time
+import collections
+
+
+class CanonicalHuffmanCodec:
+    """
+    Byte-oriented canonical Huffman codec.
+
+    Only the 256 code lengths are stored, codes are packed into a bytearray through an
+    integer bit accumulator, and decoding uses a TABLE_BITS-wide lookup table that
+    yields every complete symbol in the next TABLE_BITS bits at once.
+
+    Container layout: MAGIC, original length (uint64 big-endian), 256 code-length
+    bytes, packed payload.
+    """
+
+    MAGIC = b'HUFC'
+    MAX_CODE_LENGTH = 12
+    TABLE_BITS = MAX_CODE_LENGTH
+    HEADER = struct.Struct('>4sQ')
+
+    @classmethod
+    def build_code_lengths(cls, frequencies):
+        """
+        Returns a 256-entry list of code lengths (0 for unused bytes) for a byte
+        frequency table, limited to MAX_CODE_LENGTH by flattening frequencies.
+        """
+        freqs = [0] * 256
+        for symbol, freq in frequencies.items():
+            freqs[symbol] = freq
+        while True:
+            lengths = cls._huffman_lengths(freqs)
+            if max(lengths) <= cls.MAX_CODE_LENGTH:
+                return lengths
+            freqs = [(f + 1) // 2 if f else 0 for f in freqs]
+
+    @staticmethod
+    def _huffman_lengths(freqs):
+        lengths = [0] * 256
+        heap = [(freq, symbol, [symbol]) for symbol, freq in enumerate(freqs) if freq]
+        if not heap:
+            return lengths
+        if len(heap) == 1:
+            lengths[heap[0][1]] = 1
+            return lengths
+        heapq.heapify(heap)
+        while len(heap) > 1:
+            f1, t1, s1 = heapq.heappop(heap)
+            f2, t2, s2 = heapq.heappop(heap)
+            for symbol in s1:
+                lengths[symbol] += 1
+            for symbol in s2:
+                lengths[symbol] += 1
+            heapq.heappush(heap, (f1 + f2, min(t1, t2), s1 + s2))
+        return lengths
+
+    @staticmethod
+    def canonical_codes(lengths):
+        """
+        Assigns canonical codes: shorter codes first, ties broken by byte value.
+        Returns a 256-entry list of integer codes.
+        """
+        codes = [0] * 256
+        code = 0
+        previous_length = 0
+        for length, symbol in sorted((l, s) for s, l in enumerate(lengths) if l):
+            code <<= length - previous_length
+            codes[symbol] = code
+            code += 1
+            previous_length = length
+        return codes
+
+    @classmethod
+    def _decode_tables(cls, lengths):
+        table_bits = cls.TABLE_BITS
+        single_symbol = [0] * (1 << table_bits)
+        single_length = [table_bits + 1] * (1 << table_bits)
+        for symbol, code in enumerate(cls.canonical_codes(lengths)):
+            length = lengths[symbol]
+            if not length:
+                continue
+            start = code << (table_bits - length)
+            end = (code + 1) << (table_bits - length)
+            single_symbol[start:end] = [symbol] * (end - start)
+            single_length[start:end] = [length] * (end - start)
+
+        mask = (1 << table_bits) - 1
+        symbols_table = []
+        used_table = []
+        for index in range(1 << table_bits):
+            out = bytearray()
+            bits_left = table_bits
+            while bits_left:
+                peek = (index << (table_bits - bits_left)) & mask
+                length = single_length[peek]
+                if length > bits_left:
+                    break
+                out.append(single_symbol[peek])
+                bits_left -= length
+            symbols_table.append(bytes(out))
+            used_table.append(table_bits - bits_left)
+        return symbols_table, used_table
+
+    @classmethod
+    def encode_payload(cls, data, lengths):
+        """
+        Packs the canonical codes for data into bytes, two input bytes per step through
+        a pair code table. The final byte is zero padded. Raises ValueError if data
+        contains a byte that has no code (e.g. a shared table built from other data).
+        """
+        codes = cls.canonical_codes(lengths)
+        present = [symbol for symbol in range(256) if lengths[symbol]]
+        absent = bytes(symbol for symbol in range(256) if not lengths[symbol])
+        raw = bytes(data)
+        if absent and len(raw.translate(None, absent)) != len(raw):
+            raise ValueError("Data contains bytes with no code in the given code lengths.")
+        first_shift, second_shift = (0, 8) if sys.byteorder == 'little' else (8, 0)
+        pair_codes = [0] * 65536
+        pair_lengths = [0] * 65536
+        for first in present:
+            for second in present:
+                key = (first << first_shift) | (second << second_shift)
+                pair_codes[key] = (codes[first] << lengths[second]) | codes[second]
+                pair_lengths[key] = lengths[first] + lengths[second]
+
+        data = memoryview(data).cast('B')
+        even = len(data) & ~1
+        out = bytearray()
+        acc = 0
+        nbits = 0
+        for pair in data[:even].cast('H'):
+            length = pair_lengths[pair]
+            acc = (acc << length) | pair_codes[pair]
+            nbits += length
+            if nbits >= 32:
+                nbits -= 32
+                out += (acc >> nbits).to_bytes(4, 'big')
+                acc &= (1 << nbits) - 1
+        if even != len(data):
+            last = data[-1]
+            acc = (acc << lengths[last]) | codes[last]
+            nbits += lengths[last]
+        while nbits >= 8:
+            nbits -= 8
+            out.append((acc >> nbits) & 0xFF)
+        if nbits:
+            out.append((acc << (8 - nbits)) & 0xFF)
+        return bytes(out)
+
+    @classmethod
+    def decode_payload(cls, payload, lengths, original_length):
+        """
+        Decodes original_length bytes from a packed payload using the lookup tables.
+        """
+        if original_length == 0:
+            return b''
+        symbols_table, used_table = cls._decode_tables(lengths)
+        table_bits = cls.TABLE_BITS
+        mask = (1 << table_bits) - 1
+        data = bytes(payload) + b'\0' * 12
+        limit = len(payload) + 6
+        out = bytearray()
+        acc = 0
+        nbits = 0
+        pos = 0
+        while len(out) < original_length:
+            if pos >= limit:
+                raise ValueError("Huffman payload is truncated.")
+            acc = ((acc & ((1 << nbits) - 1)) << 48) | int.from_bytes(data[pos:pos + 6], 'big')
+            pos += 6
+            nbits += 48
+            while nbits >= table_bits:
+                index = (acc >> (nbits - table_bits)) & mask
+                used = used_table[index]
+                if not used:
+                    raise ValueError("Invalid Huffman code in payload.")
+                out += symbols_table[index]
+                nbits -= used
+        del out[original_length:]
+        return bytes(out)
+
+    def encode(self, data):
+        data = bytes(data)
+        lengths = self.build_code_lengths(collections.Counter(data))
+        header = self.HEADER.pack(self.MAGIC, len(data)) + bytes(lengths)
+        return header + self.encode_payload(data, lengths)
+
+    def decode(self, blob):
+        blob = memoryview(blob)
+        magic, original_length = self.HEADER.unpack_from(blob)
+        if magic != self.MAGIC:
+            raise ValueError("Not a canonical Huffman stream.")
+        offset = self.HEADER.size
+        lengths = list(blob[offset:offset + 256])
+        return self.decode_payload(blob[offset + 256:], lengths, original_length)
+
+
+def benchmark_huffman_codecs(size=1 << 20, seed=0):
+    """
+    Compares encode/decode throughput in MB/s of HuffmanCompressor and
+    CanonicalHuffmanCodec on size bytes of English-like ASCII text.
+    """
+    import random
+    rng = random.Random(seed)
+    words = ("the of and to in is huffman coding compression entropy table block "
+             "stream symbol canonical decode encode length bits byte data").split()
+    text = []
+    total = 0
+    while total < size:
+        word = rng.choice(words)
+        text.append(word)
+        total += len(word) + 1
+    text = " ".join(text)[:size]
+    data = text.encode('ascii')
+    megabytes = len(data) / 1e6
+    results = {}
+
+    legacy = HuffmanCompressor()
+    t0 = time.perf_counter()
+    compressed, codes, padding = legacy.compress(text)
+    results["string_encode_mb_s"] = megabytes / (time.perf_counter() - t0)
+    t0 = time.perf_counter()
+    assert legacy.decompress(compressed, codes, padding) == text
+    results["string_decode_mb_s"] = megabytes / (time.perf_counter() - t0)
+
+    codec = CanonicalHuffmanCodec()
+    t0 = time.perf_counter()
+    blob = codec.encode(data)
+    results["canonical_encode_mb_s"] = megabytes / (time.perf_counter() - t0)
+    t0 = time.perf_counter()
+    assert codec.decode(blob) == data
+    results["canonical_decode_mb_s"] = megabytes / (time.perf_counter() - t0)
+
+    results["string_compressed_bytes"] = len(compressed)
+    results["canonical_compressed_bytes"] = len(blob)
+    return results
+
+# Additional implementation at 2026-10-19 17:48:26
+import struct
+import collections
+
+
+class StreamingHuffmanCompressor:
+    """
+    Constant-memory file compression built on CanonicalHuffmanCodec.
+
+    With a shared table the input is read twice: once in chunks to count byte
+    frequencies, then block by block to encode. With adaptive=True each block gets
+    its own table and the input is read only once.
+
+    Container layout: MAGIC, flags byte, the 256 shared code lengths (shared mode
+    only), then frames of (original length, payload length) as uint32 big-endian,
+    the block's 256 code lengths (adaptive mode only) and the payload. A frame with
+    original length 0 ends the stream.
+    """
+
+    MAGIC = b'HUFS'
+    FLAG_ADAPTIVE = 0x01
+    FRAME = struct.Struct('>II')
+
+    def __init__(self, block_size=1 << 20, adaptive=False):
+        if block_size <= 0 or block_size >= 1 << 32:
+            raise ValueError("block_size must be between 1 and 2**32 - 1 bytes.")
+        self.block_size = block_size
+        self.adaptive = adaptive
+        self.codec = CanonicalHuffmanCodec()
+
+    def _iter_blocks(self, f):
+        while True:
+            block = f.read(self.block_size)
+            if not block:
+                return
+            yield block
+
+    def count_frequencies(self, input_filepath):
+        frequencies = collections.Counter()
+        with open(input_filepath, 'rb') as f:
+            for block in self._iter_blocks(f):
+                frequencies.update(block)
+        return frequencies
+
+    def compress_file(self, input_filepath, output_filepath):
+        shared_lengths = None
+        if not self.adaptive:
+            shared_lengths = self.codec.build_code_lengths(self.count_frequencies(input_filepath))
+
+        with open(input_filepath, 'rb') as src, open(output_filepath, 'wb') as dst:
+            dst.write(self.MAGIC)
+            dst.write(bytes([self.FLAG_ADAPTIVE if self.adaptive else 0]))
+            if not self.adaptive:
+                dst.write(bytes(shared_lengths))
+
+            for block in self._iter_blocks(src):
+                if self.adaptive:
+                    lengths = self.codec.build_code_lengths(collections.Counter(block))
+                else:
+                    lengths = shared_lengths
+                payload = self.codec.encode_payload(block, lengths)
+                dst.write(self.FRAME.pack(len(block), len(payload)))
+                if self.adaptive:
+                    dst.write(bytes(lengths))
+                dst.write(payload)
+            dst.write(self.FRAME.pack(0, 0))
+
+    def _read_exact(self, f, size):
+        data = f.read(size)
+        if len(data) != size:
+            raise ValueError("Compressed stream is truncated.")
+        return data
+
+    def decompress_file(self, input_filepath, output_filepath):
+        with open(input_filepath, 'rb') as src, open(output_filepath, 'wb') as dst:
+            if self._read_exact(src, len(self.MAGIC)) != self.MAGIC:
+                raise ValueError("Not a streaming Huffman file.")
+            adaptive = bool(self._read_exact(src, 1)[0] & self.FLAG_ADAPTIVE)
+            shared_lengths = None if adaptive else list(self._read_exact(src, 256))
+
+            while True:
+                original_length, payload_length = self.FRAME.unpack(self._read_exact(src, self.FRAME.size))
+                if original_length == 0:
+                    break
+                lengths = list(self._read_exact(src, 256)) if adaptive else shared_lengths
+                payload = self._read_exact(src, payload_length)
+                dst.write(self.codec.decode_payload(payload, lengths, original_length))
+
+# Additional implementation at 2026-10-19 19:05:13
+import os
+import struct
+import collections
+from concurrent.futures import ProcessPoolExecutor
+
+BLOCK_MAGIC = b'BLKC'
+BLOCK_HEADER = struct.Struct('>4sBI')
+BLOCK_INDEX_ENTRY = struct.Struct('>QII')
+BLOCK_FOOTER = struct.Struct('>QI4s')
+BLOCK_CODEC_HUFFMAN = 1
+BLOCK_CODEC_RLE = 2
+BLOCK_CODECS = {}
+
+
+def _ordered_parallel_map(executor, fn, items, window):
+    """
+    Like executor.map, but keeps at most window tasks in flight so a large input
+    is never submitted, or held in memory, all at once. Results come back in order.
+    """
+    pending = collections.deque()
+    for item in items:
+        pending.append(executor.submit(fn, item))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def _encode_block_task(task):
+    codec_id, block = task
+    return len(block), BLOCK_CODECS[codec_id][0](block)
+
+
+def _decode_block_task(task):
+    codec_id, payload, original_length = task
+    return BLOCK_CODECS[codec_id][1](payload, original_length)
+
+
+class BlockContainerCompressor:
+    """
+    Splits input into independent blocks, compresses them on a ProcessPoolExecutor
+    and writes them with a trailing index, so decompression can run in parallel
+    and any single block can be read without touching the others.
+
+    Container layout: header (BLOCK_MAGIC, codec id byte, block size as uint32), the
+    compressed blocks back to back, one index entry per block (offset as uint64,
+    original and compressed length as uint32), then a footer (index offset,
+    block count, BLOCK_MAGIC). All integers are big-endian. Subclasses set CODEC_ID
+    to a key of BLOCK_CODECS, which maps it to (encode(block), decode(payload,
+    original_length)) functions.
+    """
+
+    CODEC_ID = None
+
+    def __init__(self, block_size=1 << 20, workers=None):
+        if block_size <= 0 or block_size >= 1 << 32:
+            raise ValueError("block_size must be between 1 and 2**32 - 1 bytes.")
+        self.block_size = block_size
+        self.workers = workers or os.cpu_count() or 1
+
+    def _iter_blocks(self, f):
+        while True:
+            block = f.read(self.block_size)
+            if not block:
+                return
+            yield block
+
+    def compress_file(self, input_filepath, output_filepath):
+        index = []
+        with open(input_filepath, 'rb') as src, open(output_filepath, 'wb') as dst, \
+                ProcessPoolExecutor(max_workers=self.workers) as executor:
+            dst.write(BLOCK_HEADER.pack(BLOCK_MAGIC, self.CODEC_ID, self.block_size))
+            tasks = ((self.CODEC_ID, block) for block in self._iter_blocks(src))
+            for original_length, encoded in _ordered_parallel_map(executor, _encode_block_task, tasks,
+                                                                  self.workers * 2):
+                index.append((dst.tell(), original_length, len(encoded)))
+                dst.write(encoded)
+
+            index_offset = dst.tell()
+            for entry in index:
+                dst.write(BLOCK_INDEX_ENTRY.pack(*entry))
+            dst.write(BLOCK_FOOTER.pack(index_offset, len(index), BLOCK_MAGIC))
+
+    @classmethod
+    def read_index(cls, f):
+        """
+        Returns (codec_id, block_size, [(offset, original_length, compressed_length), ...]).
+        """
+        f.seek(0)
+        magic, codec_id, block_size = BLOCK_HEADER.unpack(f.read(BLOCK_HEADER.size))
+        if magic != BLOCK_MAGIC:
+            raise ValueError("Not a block container file.")
+        f.seek(-BLOCK_FOOTER.size, os.SEEK_END)
+        index_offset, block_count, footer_magic = BLOCK_FOOTER.unpack(f.read(BLOCK_FOOTER.size))
+        if footer_magic != BLOCK_MAGIC:
+            raise ValueError("Block container footer is missing or corrupt.")
+        f.seek(index_offset)
+        raw_index = f.read(block_count * BLOCK_INDEX_ENTRY.size)
+        index = [BLOCK_INDEX_ENTRY.unpack_from(raw_index, i * BLOCK_INDEX_ENTRY.size)
+                 for i in range(block_count)]
+        return codec_id, block_size, index
+
+    @staticmethod
+    def _check_codec(codec_id):
+        if codec_id not in BLOCK_CODECS:
+            raise ValueError(f"Block codec id {codec_id} is not available in this module.")
+
+    @classmethod
+    def read_block(cls, input_filepath, block_number):
+        """
+        Decompresses a single block by seeking straight to it through the index.
+        """
+        with open(input_filepath, 'rb') as f:
+            codec_id, _, index = cls.read_index(f)
+            cls._check_codec(codec_id)
+            offset, original_length, compressed_length = index[block_number]
+            f.seek(offset)
+            return _decode_block_task((codec_id, f.read(compressed_length), original_length))
+
+    def decompress_file(self, input_filepath, output_filepath):
+        with open(input_filepath, 'rb') as src:
+            codec_id, _, index = self.read_index(src)
+            self._check_codec(codec_id)
+
+            def tasks():
+                for offset, original_length, compressed_length in index:
+                    src.seek(offset)
+                    yield codec_id, src.read(compressed_length), original_length
+
+            with open(output_filepath, 'wb') as dst, ProcessPoolExecutor(max_workers=self.workers) as executor:
+                for block in _ordered_parallel_map(executor, _decode_block_task, tasks(), self.workers * 2):
+                    dst.write(block)
+
+
+def _huffman_encode_block(block):
+    codec = CanonicalHuffmanCodec
+    lengths = codec.build_code_lengths(collections.Counter(block))
+    return bytes(lengths) + codec.encode_payload(block, lengths)
+
+
+def _huffman_decode_block(payload, original_length):
+    payload = memoryview(payload)
+    return CanonicalHuffmanCodec.decode_payload(payload[256:], list(payload[:256]), original_length)
+
+
+BLOCK_CODECS[BLOCK_CODEC_HUFFMAN] = (_huffman_encode_block, _huffman_decode_block)
+
+
+class HuffmanBlockCompressor(BlockContainerCompressor):
+    """
+    Parallel block-wise Huffman compression; each block carries its own canonical
+    code lengths followed by the packed payload.
+    """
+
+    CODEC_ID = BLOCK_CODEC_HUFFMAN
@@ -0,0 +1,52 @@
+import importlib.util
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+MODULE_PATH = os.path.join(os.path.dirname(__file__), os.pardir, "file_20250620001914173806_4638.py")
+
+
+@pytest.fixture(scope="module")
+def csv_merge():
+    spec = importlib.util.spec_from_file_location("csv_merge", MODULE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    # Registered so the process pool can pickle the worker function by module name.
+    sys.modules["csv_merge"] = module
+    spec.loader.exec_module(module)
+    yield module
+    del sys.modules["csv_merge"]
+
+
+@pytest.fixture
+def input_files(tmp_path):
+    first = tmp_path / "a.csv"
+    second = tmp_path / "b.csv"
+    first.write_text("id,name,price\n1,apple,1.5\n2,pear,2.0\n1,apple,1.5\n")
+    second.write_text("id,name,price,in_stock\n3,plum,0.5,true\n2,pear,2.0,false\n")
+    return [str(first), str(second)]
+
+
+def test_unknown_dtype_columns_are_rejected(csv_merge, input_files, tmp_path):
+    with pytest.raises(ValueError, match="missing"):
+        csv_merge.merge_csv_files_parallel(input_files, str(tmp_path / "out.csv"), workers=1,
+                                           dtypes={"missing": "float64"})
+    assert not os.path.exists(tmp_path / "out.csv")
+
+
+@pytest.mark.parametrize("extension", ["parquet", "feather"])
+def test_arrow_output_round_trips(csv_merge, input_files, tmp_path, extension):
+    pytest.importorskip("pyarrow")
+    output = str(tmp_path / f"out.{extension}")
+
+    stats = csv_merge.merge_csv_files_parallel(input_files, output, drop_duplicates=True, workers=1)
+
+    reader = pd.read_parquet if extension == "parquet" else pd.read_feather
+    merged = reader(output)
+    assert list(merged.columns) == ["id", "name", "price", "in_stock"]
+    assert merged["id"].tolist() == [1, 2, 3, 2]
+    assert merged["in_stock"].isna().tolist() == [True, True, False, False]
+    assert stats["rows_read"] == 5
+    assert stats["rows_written"] == 4
+    assert stats["duplicates_dropped"] == 1